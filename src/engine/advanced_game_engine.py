@@ -448,6 +448,7 @@ class AdvancedGameEngine:
         self.paused = False
         self.target_fps = 60
         self.clock = pygame.time.Clock()
+        self.render_system.fps_clock = self.clock  # Debug HUD reads FPS from the game loop clock
         self.delta_time = 0
         self.frame_count = 0
         self.game_time = 0
@@ -594,8 +595,8 @@ class AdvancedGameEngine:
                 self.active_scene.update(self.delta_time)
                 
                 # Apply weather effects to game objects
-                for game_object in self.active_scene.game_objects:
-                    self.weather_system.apply_weather_effects(game_object, self.delta_time)
+                self.weather_system.apply_weather_effects_to_objects(self.active_scene.game_objects,
+                                                                     self.delta_time)
             
             # Clear screen
             self.screen.fill((0, 0, 0))
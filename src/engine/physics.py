@@ -3,15 +3,49 @@ Physics System for MCP Games
 """
 
 import math
-from typing import Dict, List, Tuple, Any, Optional, Set
-from dataclasses import dataclass
+from collections import Counter
+from typing import Dict, List, Tuple, Any, Optional, Set, Iterator
+
+import numpy as np
+
+try:
+    import cupy
+except ImportError:  # CuPy is optional; without it detection stays on the CPU
+    cupy = None
+
+# Layer collision filtering uses one uint64 bitmask per layer
+MAX_COLLISION_LAYERS = 64
+
+# Above this many spheres the (N, N) radius-sum matrix is not cached
+RADII_MATRIX_MAX_SPHERES = 512
+
+# Candidate pairs are generated and tested in row blocks of about this many
+# pairs, so CPU detection memory stays bounded in large scenes
+PAIR_BLOCK_SIZE = 1 << 18
+
+# Sphere counts from which detection runs on the GPU when CuPy is available
+GPU_MIN_SPHERES = 10000
+GPU_TILE_ROWS = 256
 
-@dataclass
 class Vector3:
     """3D Vector class"""
-    x: float = 0.0
-    y: float = 0.0
-    z: float = 0.0
+    # Slots keep vectors small and attribute access fast; they are created constantly
+    __slots__ = ('x', 'y', 'z')
+    
+    def __init__(self, x: float = 0.0, y: float = 0.0, z: float = 0.0):
+        self.x = x
+        self.y = y
+        self.z = z
+    
+    def __repr__(self):
+        return f"Vector3(x={self.x!r}, y={self.y!r}, z={self.z!r})"
+    
+    def __eq__(self, other):
+        if other.__class__ is not self.__class__:
+            return NotImplemented
+        return (self.x, self.y, self.z) == (other.x, other.y, other.z)
+    
+    __hash__ = None  # Mutable, so unhashable
     
     def __add__(self, other):
         return Vector3(self.x + other.x, self.y + other.y, self.z + other.z)
@@ -60,6 +94,8 @@ class Vector3:
 class Collider:
     """Base class for all colliders"""
     
+    __slots__ = ('game_object', 'position', 'is_trigger', 'layer')
+    
     def __init__(self, game_object: Any):
         self.game_object = game_object
         self.position = Vector3.from_tuple(game_object.position)
@@ -68,7 +104,9 @@ class Collider:
     
     def update_position(self):
         """Update collider position based on game object"""
-        self.position = Vector3.from_tuple(self.game_object.position)
+        # Written in place so no Vector3 is allocated per collider per frame
+        position = self.position
+        position.x, position.y, position.z = self.game_object.position
     
     def intersects(self, other: 'Collider') -> bool:
         """Check if this collider intersects with another"""
@@ -78,10 +116,24 @@ class Collider:
 class SphereCollider(Collider):
     """Spherical collision volume"""
     
+    __slots__ = ('_radius', '_owners')
+    
     def __init__(self, game_object: Any, radius: float = 1.0):
         super().__init__(game_object)
+        # Physics systems holding this collider, told to refresh cached radii
+        self._owners = []
         self.radius = radius
     
+    @property
+    def radius(self) -> float:
+        return self._radius
+    
+    @radius.setter
+    def radius(self, value: float):
+        self._radius = value
+        for system in self._owners:
+            system._static_dirty = True
+    
     def intersects(self, other: Collider) -> bool:
         """Check if this sphere collider intersects with another collider"""
         if isinstance(other, SphereCollider):
@@ -90,24 +142,52 @@ class SphereCollider(Collider):
             return distance < (self.radius + other.radius)
         elif isinstance(other, BoxCollider):
             # Sphere-Box collision (simplified)
-            closest_point = Vector3(
-                max(other.min.x, min(self.position.x, other.max.x)),
-                max(other.min.y, min(self.position.y, other.max.y)),
-                max(other.min.z, min(self.position.z, other.max.z))
-            )
-            distance = self.position.distance_to(closest_point)
-            return distance < self.radius
+            return _sphere_box_intersect(self, other)
         return False
 
 
 class BoxCollider(Collider):
     """Box-shaped collision volume"""
     
+    __slots__ = ('_size', '_min', '_max')
+    
     def __init__(self, game_object: Any, size: Vector3 = Vector3(1.0, 1.0, 1.0)):
         super().__init__(game_object)
+        # Bounds live in flat float arrays that are rewritten in place every frame
+        self._min = np.empty(3, dtype=np.float64)
+        self._max = np.empty(3, dtype=np.float64)
         self.size = size
+    
+    @property
+    def size(self) -> Vector3:
+        return self._size
+    
+    @size.setter
+    def size(self, value: Vector3):
+        self._size = value
         self.update_bounds()
     
+    # min and max are returned as copies of the bound arrays, so mutating the
+    # returned Vector3 has no effect. Assigning writes the bound until the next
+    # update_bounds() recomputes it from position and size, as before
+    @property
+    def min(self) -> Vector3:
+        """Minimum corner of the box"""
+        return Vector3(*self._min.tolist())
+    
+    @min.setter
+    def min(self, value: Vector3):
+        self._min[:] = (value.x, value.y, value.z)
+    
+    @property
+    def max(self) -> Vector3:
+        """Maximum corner of the box"""
+        return Vector3(*self._max.tolist())
+    
+    @max.setter
+    def max(self, value: Vector3):
+        self._max[:] = (value.x, value.y, value.z)
+    
     def update_position(self):
         """Update collider position and bounds"""
         super().update_position()
@@ -115,59 +195,254 @@ class BoxCollider(Collider):
     
     def update_bounds(self):
         """Update min and max bounds based on position and size"""
-        half_size = self.size * 0.5
-        self.min = self.position - half_size
-        self.max = self.position + half_size
+        # Half extents are read from size every time, so in-place edits of size apply
+        x, y, z = self.position.x, self.position.y, self.position.z
+        size = self._size
+        hx, hy, hz = size.x * 0.5, size.y * 0.5, size.z * 0.5
+        box_min, box_max = self._min, self._max
+        box_min[0], box_min[1], box_min[2] = x - hx, y - hy, z - hz
+        box_max[0], box_max[1], box_max[2] = x + hx, y + hy, z + hz
     
     def intersects(self, other: Collider) -> bool:
         """Check if this box collider intersects with another collider"""
         if isinstance(other, BoxCollider):
             # Box-Box collision
+            min_ax, min_ay, min_az = self._min.tolist()
+            max_ax, max_ay, max_az = self._max.tolist()
+            min_bx, min_by, min_bz = other._min.tolist()
+            max_bx, max_by, max_bz = other._max.tolist()
             return (
-                self.min.x <= other.max.x and self.max.x >= other.min.x and
-                self.min.y <= other.max.y and self.max.y >= other.min.y and
-                self.min.z <= other.max.z and self.max.z >= other.min.z
+                min_ax <= max_bx and max_ax >= min_bx and
+                min_ay <= max_by and max_ay >= min_by and
+                min_az <= max_bz and max_az >= min_bz
             )
         elif isinstance(other, SphereCollider):
-            # Box-Sphere collision (call the sphere's method)
-            return other.intersects(self)
+            # Box-Sphere collision
+            return _sphere_box_intersect(other, self)
         return False
 
 
+def _layer_filtered_pair_blocks(layers: np.ndarray, layer_masks: np.ndarray,
+                                block_size: int = PAIR_BLOCK_SIZE) -> Iterator[Tuple[np.ndarray, np.ndarray]]:
+    """Yield the index pairs i < j whose layers are allowed to collide, in row blocks
+    
+    Each block covers about block_size candidate pairs, so memory is bounded
+    by the block rather than growing with N^2. Pairs come out in i < j scan order.
+    """
+    n = len(layers)
+    columns = np.arange(n)
+    rows_per_block = max(1, block_size // n)
+    for start in range(0, n - 1, rows_per_block):
+        stop = min(start + rows_per_block, n - 1)
+        i, j = np.nonzero(columns[None, :] > np.arange(start, stop)[:, None])
+        i += start
+        
+        # Layer filter is a single shift-and-mask per candidate pair
+        allowed = ((layer_masks[layers[i]] >> layers[j].astype(np.uint64)) & np.uint64(1)).astype(bool)
+        yield i[allowed], j[allowed]
+
+
+def _detect_sphere_pairs(positions: np.ndarray, radii: np.ndarray,
+                         layers: np.ndarray, layer_masks: np.ndarray,
+                         radii_sum_sq: Optional[np.ndarray] = None) -> np.ndarray:
+    """Broad and narrow phase for spheres in a single vectorized pass
+    
+    positions is (N, 3), radii and layers are (N,), and layer_masks holds one
+    bitmask per layer with bit j set when that layer collides with layer j.
+    radii_sum_sq is an optional precomputed (N, N) matrix of squared radius sums.
+    Returns an (M, 2) int32 array of colliding index pairs with i < j.
+    """
+    if len(positions) < 2:
+        return np.empty((0, 2), dtype=np.int32)
+    
+    if cupy is not None and len(positions) >= GPU_MIN_SPHERES:
+        return _detect_sphere_pairs_tiled(cupy, positions, radii, layers, layer_masks)
+    
+    hits = []
+    for i, j in _layer_filtered_pair_blocks(layers, layer_masks):
+        # Compare squared distances against squared radius sums
+        delta = positions[i] - positions[j]
+        dist_sq = np.einsum("ij,ij->i", delta, delta)
+        if radii_sum_sq is not None:
+            hit = dist_sq < radii_sum_sq[i, j]
+        else:
+            radius_sum = radii[i] + radii[j]
+            hit = dist_sq < radius_sum * radius_sum
+        hits.append(np.stack((i[hit], j[hit]), axis=1))
+    
+    return np.concatenate(hits).astype(np.int32)
+
+
+def _detect_sphere_pairs_tiled(xp: Any, positions: np.ndarray, radii: np.ndarray,
+                               layers: np.ndarray, layer_masks: np.ndarray,
+                               tile_rows: int = GPU_TILE_ROWS) -> np.ndarray:
+    """Sphere detection as row tiles of an all-pairs broadcast on array module xp
+    
+    Meant for very large scenes on the GPU (xp is cupy). Inputs are uploaded
+    once and only the integer pair list is copied back, and each tile of
+    tile_rows rows bounds device memory to O(tile_rows * N).
+    Returns the same (M, 2) int32 array as _detect_sphere_pairs.
+    """
+    n = len(positions)
+    pos = xp.asarray(positions, dtype=xp.float64)
+    rad = xp.asarray(radii, dtype=xp.float64)
+    lay = xp.asarray(layers, dtype=xp.int64)
+    row_masks = xp.asarray(layer_masks, dtype=xp.uint64)[lay]
+    columns = xp.arange(n)
+    
+    tiles = []
+    for start in range(0, n, tile_rows):
+        stop = min(start + tile_rows, n)
+        delta = pos[start:stop, None, :] - pos[None, :, :]
+        dist_sq = (delta * delta).sum(axis=-1)
+        radius_sum = rad[start:stop, None] + rad[None, :]
+        
+        hit = dist_sq < radius_sum * radius_sum
+        hit &= columns[None, :] > xp.arange(start, stop)[:, None]
+        hit &= ((row_masks[start:stop, None] >> lay[None, :].astype(xp.uint64)) & 1).astype(bool)
+        # Shifting by the sentinel layer is not defined on every backend
+        hit &= lay[None, :] < MAX_COLLISION_LAYERS
+        
+        # argwhere is row-major, so pairs come out in i < j scan order
+        tile_pairs = xp.argwhere(hit)
+        tile_pairs[:, 0] += start
+        tiles.append(tile_pairs)
+    
+    pairs = xp.concatenate(tiles).astype(xp.int32)
+    return pairs.get() if hasattr(pairs, "get") else np.asarray(pairs)
+
+
+def _detect_box_pairs(mins: np.ndarray, maxs: np.ndarray,
+                      layers: np.ndarray, layer_masks: np.ndarray) -> np.ndarray:
+    """AABB overlap for boxes in a single vectorized pass
+    
+    All six axis comparisons are combined with a bitwise AND and reduced once,
+    so there is no per-axis short-circuit branching.
+    Returns an (M, 2) int32 array of overlapping index pairs with i < j.
+    """
+    if len(mins) < 2:
+        return np.empty((0, 2), dtype=np.int32)
+    
+    hits = []
+    for i, j in _layer_filtered_pair_blocks(layers, layer_masks):
+        hit = ((mins[i] <= maxs[j]) & (mins[j] <= maxs[i])).all(axis=1)
+        hits.append(np.stack((i[hit], j[hit]), axis=1))
+    
+    return np.concatenate(hits).astype(np.int32)
+
+
+def _detect_sphere_box_pairs(positions: np.ndarray, radii: np.ndarray, sphere_layers: np.ndarray,
+                             mins: np.ndarray, maxs: np.ndarray, box_layers: np.ndarray,
+                             layer_masks: np.ndarray, block_size: int = PAIR_BLOCK_SIZE) -> np.ndarray:
+    """Closest-point sphere/box test for every sphere against every box
+    
+    Spheres are processed in blocks of about block_size candidate pairs, so
+    memory does not grow with the full sphere-by-box product.
+    Returns an (M, 2) int32 array of (sphere index, box index) pairs.
+    """
+    if len(positions) == 0 or len(mins) == 0:
+        return np.empty((0, 2), dtype=np.int32)
+    
+    num_spheres, num_boxes = len(positions), len(mins)
+    spheres_per_block = max(1, block_size // num_boxes)
+    hits = []
+    for start in range(0, num_spheres, spheres_per_block):
+        stop = min(start + spheres_per_block, num_spheres)
+        s = np.repeat(np.arange(start, stop), num_boxes)
+        b = np.tile(np.arange(num_boxes), stop - start)
+        allowed = ((layer_masks[sphere_layers[s]] >> box_layers[b].astype(np.uint64)) & np.uint64(1)).astype(bool)
+        s, b = s[allowed], b[allowed]
+        
+        centers = positions[s]
+        delta = centers - np.clip(centers, mins[b], maxs[b])
+        hit = np.einsum("ij,ij->i", delta, delta) < radii[s] * radii[s]
+        hits.append(np.stack((s[hit], b[hit]), axis=1))
+    
+    return np.concatenate(hits).astype(np.int32)
+
+
+def _sphere_box_intersect(sphere: SphereCollider, box: BoxCollider) -> bool:
+    """Closest-point sphere/box test on scalars (no Vector3 temporaries, no sqrt)"""
+    sx, sy, sz = sphere.position.x, sphere.position.y, sphere.position.z
+    min_x, min_y, min_z = box._min.tolist()
+    max_x, max_y, max_z = box._max.tolist()
+    
+    # Clamp the sphere center onto the box
+    cx = sx if sx < max_x else max_x
+    cx = cx if cx > min_x else min_x
+    cy = sy if sy < max_y else max_y
+    cy = cy if cy > min_y else min_y
+    cz = sz if sz < max_z else max_z
+    cz = cz if cz > min_z else min_z
+    
+    # Compare squared distances to avoid the square root
+    dx, dy, dz = sx - cx, sy - cy, sz - cz
+    return dx * dx + dy * dy + dz * dz < sphere.radius * sphere.radius
+
+
 class PhysicsSystem:
     """Physics system for collision detection and resolution"""
     
     def __init__(self):
         self.colliders: List[Collider] = []
-        self.collision_matrix: Dict[int, Set[int]] = {}  # Layer-based collision filtering
+        # Layer-based collision filtering: bit j of entry i is set if layers i and j collide
+        self.collision_matrix = np.zeros(MAX_COLLISION_LAYERS, dtype=np.uint64)
         self.gravity = Vector3(0, -9.81, 0)
         self.collision_callbacks: Dict[Any, callable] = {}
+        
+        # Per-collider data that only changes when colliders are added, removed or resized
+        self._static_dirty = True
+        self._sphere_idx = np.empty(0, dtype=np.int32)
+        self._box_idx = np.empty(0, dtype=np.int32)
+        self._other_idx: List[int] = []
+        self._radii = np.empty(0, dtype=np.float64)
+        self._radii_sum_sq: Optional[np.ndarray] = None
+        
+        # Reused across frames to hold the pairs found by the general detection path
+        self._pair_buf = np.empty((1024, 2), dtype=np.int32)
+        
+        # Count of colliders per exact type, used to pick a specialized detection path
+        self._type_histogram: Counter = Counter()
     
     def add_collider(self, collider: Collider):
         """Add a collider to the physics system"""
         self.colliders.append(collider)
+        self._type_histogram[type(collider)] += 1
+        if isinstance(collider, SphereCollider):
+            collider._owners.append(self)
+        self._static_dirty = True
     
     def remove_collider(self, collider: Collider):
         """Remove a collider from the physics system"""
         if collider in self.colliders:
             self.colliders.remove(collider)
+            self._type_histogram[type(collider)] -= 1
+            if not self._type_histogram[type(collider)]:
+                del self._type_histogram[type(collider)]
+            if isinstance(collider, SphereCollider):
+                collider._owners.remove(self)
+            self._static_dirty = True
     
     def set_layer_collision(self, layer1: int, layer2: int, should_collide: bool):
         """Set whether two layers should collide with each other"""
-        if layer1 not in self.collision_matrix:
-            self.collision_matrix[layer1] = set()
+        if not (0 <= layer1 < MAX_COLLISION_LAYERS and 0 <= layer2 < MAX_COLLISION_LAYERS):
+            raise ValueError(f"Collision layers must be in range [0, {MAX_COLLISION_LAYERS})")
         
+        # The matrix is kept symmetric so a lookup never needs both directions
+        bit1 = np.uint64(1 << layer1)
+        bit2 = np.uint64(1 << layer2)
         if should_collide:
-            self.collision_matrix[layer1].add(layer2)
-        elif layer2 in self.collision_matrix[layer1]:
-            self.collision_matrix[layer1].remove(layer2)
+            self.collision_matrix[layer1] |= bit2
+            self.collision_matrix[layer2] |= bit1
+        else:
+            self.collision_matrix[layer1] &= ~bit2
+            self.collision_matrix[layer2] &= ~bit1
     
     def should_check_collision(self, layer1: int, layer2: int) -> bool:
         """Check if two layers should collide based on the collision matrix"""
-        return (
-            (layer1 in self.collision_matrix and layer2 in self.collision_matrix[layer1]) or
-            (layer2 in self.collision_matrix and layer1 in self.collision_matrix[layer2])
-        )
+        if not (0 <= layer1 < MAX_COLLISION_LAYERS and 0 <= layer2 < MAX_COLLISION_LAYERS):
+            return False
+        return bool((int(self.collision_matrix[layer1]) >> layer2) & 1)
     
     def register_collision_callback(self, game_object: Any, callback: callable):
         """Register a callback function for collision events"""
@@ -180,54 +455,228 @@ class PhysicsSystem:
             collider.update_position()
         
         # Check for collisions
-        collisions = []
-        for i, collider1 in enumerate(self.colliders):
-            for collider2 in self.colliders[i+1:]:
-                # Skip if layers shouldn't collide
-                if not self.should_check_collision(collider1.layer, collider2.layer):
-                    continue
-                
-                if collider1.intersects(collider2):
-                    collisions.append((collider1, collider2))
+        pairs = self._detect_collisions()
         
         # Handle collisions
-        for collider1, collider2 in collisions:
+        colliders = self.colliders
+        callbacks = self.collision_callbacks
+        sphere_contacts = []
+        for i, j in zip(pairs[:, 0].tolist(), pairs[:, 1].tolist()):
+            collider1 = colliders[i]
+            collider2 = colliders[j]
+            
             # Trigger callbacks if registered
-            if collider1.game_object in self.collision_callbacks:
-                self.collision_callbacks[collider1.game_object](collider1.game_object, collider2.game_object)
+            callback = callbacks.get(collider1.game_object)
+            if callback is not None:
+                callback(collider1.game_object, collider2.game_object)
             
-            if collider2.game_object in self.collision_callbacks:
-                self.collision_callbacks[collider2.game_object](collider2.game_object, collider1.game_object)
+            callback = callbacks.get(collider2.game_object)
+            if callback is not None:
+                callback(collider2.game_object, collider1.game_object)
             
             # If either is a trigger, don't resolve physically
             if collider1.is_trigger or collider2.is_trigger:
                 continue
             
+            # Sphere contacts are resolved together once all callbacks have run
+            if isinstance(collider1, SphereCollider) and isinstance(collider2, SphereCollider):
+                sphere_contacts.append((i, j))
+                continue
+            
             # Simple collision resolution (push objects apart)
             self._resolve_collision(collider1, collider2)
+        
+        if sphere_contacts:
+            self._resolve_sphere_collisions(np.array(sphere_contacts, dtype=np.int32))
+    
+    def _detect_sphere_only(self, layers: np.ndarray, layer_masks: np.ndarray) -> np.ndarray:
+        """Detection path for scenes made only of spheres"""
+        positions = np.array([(c.position.x, c.position.y, c.position.z) for c in self.colliders],
+                             dtype=np.float64)
+        # Kernel indices are collider indices and already in i < j scan order
+        return _detect_sphere_pairs(positions, self._radii, layers,
+                                    layer_masks, self._radii_sum_sq)
+    
+    def _detect_box_only(self, layers: np.ndarray, layer_masks: np.ndarray) -> np.ndarray:
+        """Detection path for scenes made only of boxes"""
+        colliders = self.colliders
+        mins = np.array([c._min for c in colliders])
+        maxs = np.array([c._max for c in colliders])
+        return _detect_box_pairs(mins, maxs, layers, layer_masks)
+    
+    def _refresh_static_data(self):
+        """Rebuild the collider partition and cached radii if anything changed"""
+        if not self._static_dirty:
+            return
+        
+        colliders = self.colliders
+        self._sphere_idx = np.array([k for k, c in enumerate(colliders)
+                                     if isinstance(c, SphereCollider)], dtype=np.int32)
+        self._box_idx = np.array([k for k, c in enumerate(colliders)
+                                  if isinstance(c, BoxCollider)], dtype=np.int32)
+        self._other_idx = [k for k, c in enumerate(colliders)
+                           if not isinstance(c, (SphereCollider, BoxCollider))]
+        
+        self._radii = np.fromiter((colliders[k].radius for k in self._sphere_idx.tolist()),
+                                  dtype=np.float64, count=len(self._sphere_idx))
+        if len(self._radii) <= RADII_MATRIX_MAX_SPHERES:
+            radius_sum = self._radii[:, None] + self._radii
+            self._radii_sum_sq = radius_sum * radius_sum
+        else:
+            self._radii_sum_sq = None
+        
+        self._static_dirty = False
+    
+    def _detect_collisions(self) -> np.ndarray:
+        """Find all colliding pairs as an (M, 2) array of collider indices"""
+        colliders = self.colliders
+        n = len(colliders)
+        if n < 2:
+            return np.empty((0, 2), dtype=np.int32)
+        
+        layers = np.fromiter((c.layer for c in colliders), dtype=np.int64, count=n)
+        
+        # Out-of-range layers never collide, as in should_check_collision. They map
+        # to a sentinel layer whose mask is empty and which no mask has a bit for
+        layers[(layers < 0) | (layers >= MAX_COLLISION_LAYERS)] = MAX_COLLISION_LAYERS
+        layer_masks = np.append(self.collision_matrix, np.uint64(0))
+        
+        self._refresh_static_data()
+        
+        # Homogeneous scenes skip the partition and the mixed-pair pass entirely
+        if len(self._type_histogram) == 1:
+            collider_type = next(iter(self._type_histogram))
+            if collider_type is SphereCollider:
+                return self._detect_sphere_only(layers, layer_masks)
+            if collider_type is BoxCollider:
+                return self._detect_box_only(layers, layer_masks)
+        
+        sphere_idx = self._sphere_idx
+        box_idx = self._box_idx
+        other_idx = self._other_idx
+        
+        # Sphere-sphere and box-box pairs are each tested in one vectorized pass
+        spheres = [colliders[k] for k in sphere_idx.tolist()]
+        positions = np.array([(c.position.x, c.position.y, c.position.z) for c in spheres],
+                             dtype=np.float64).reshape(-1, 3)
+        sphere_pairs = sphere_idx[_detect_sphere_pairs(positions, self._radii, layers[sphere_idx],
+                                                       layer_masks, self._radii_sum_sq)]
+        
+        boxes = [colliders[k] for k in box_idx.tolist()]
+        mins = np.array([c._min for c in boxes], dtype=np.float64).reshape(-1, 3)
+        maxs = np.array([c._max for c in boxes], dtype=np.float64).reshape(-1, 3)
+        box_pairs = box_idx[_detect_box_pairs(mins, maxs, layers[box_idx], layer_masks)]
+        
+        # The flat bound arrays also let sphere-box pairs run as one pass
+        local_pairs = _detect_sphere_box_pairs(positions, self._radii, layers[sphere_idx],
+                                               mins, maxs, layers[box_idx], layer_masks)
+        mixed_pairs = np.stack((sphere_idx[local_pairs[:, 0]], box_idx[local_pairs[:, 1]]), axis=1)
+        mixed_pairs.sort(axis=1)
+        
+        # Other collider types go through intersects()
+        layer_list = layers.tolist()
+        mask_list = [int(m) for m in layer_masks]
+        candidates = []
+        for k, a in enumerate(other_idx):
+            candidates.extend((a, b) for b in sphere_idx.tolist())
+            candidates.extend((a, b) for b in box_idx.tolist())
+            candidates.extend((a, b) for b in other_idx[k + 1:])
+        
+        # Flat [i0, j0, i1, j1, ...] list so no tuple is kept per hit
+        other_pairs = []
+        for a, b in candidates:
+            i, j = (a, b) if a < b else (b, a)
+            if not (mask_list[layer_list[i]] >> layer_list[j]) & 1:
+                continue
+            if colliders[i].intersects(colliders[j]):
+                other_pairs += (i, j)
+        
+        # Gather every hit into the reusable pair buffer
+        count = len(sphere_pairs) + len(box_pairs) + len(mixed_pairs) + len(other_pairs) // 2
+        pairs = self._pair_buffer(count)
+        start = 0
+        for kernel_pairs in (sphere_pairs, box_pairs, mixed_pairs):
+            pairs[start:start + len(kernel_pairs)] = kernel_pairs
+            start += len(kernel_pairs)
+        pairs[start:].flat = other_pairs
+        
+        # Keep the dispatch order of a plain i < j scan
+        pairs[:] = pairs[np.lexsort((pairs[:, 1], pairs[:, 0]))]
+        return pairs
+    
+    def _pair_buffer(self, count: int) -> np.ndarray:
+        """View of the first count rows of the pair buffer, grown geometrically
+        
+        The buffer is reused every frame, so the view is only valid until the
+        next detection pass.
+        """
+        if count > len(self._pair_buf):
+            capacity = len(self._pair_buf)
+            while capacity < count:
+                capacity *= 2
+            self._pair_buf = np.empty((capacity, 2), dtype=np.int32)
+        return self._pair_buf[:count]
     
     def _resolve_collision(self, collider1: Collider, collider2: Collider):
         """Simple collision resolution"""
         # Only handle sphere-sphere for simplicity in this example
         if isinstance(collider1, SphereCollider) and isinstance(collider2, SphereCollider):
-            direction = Vector3.from_tuple(collider1.game_object.position) - Vector3.from_tuple(collider2.game_object.position)
-            distance = direction.magnitude()
+            # Work on the position tuples directly instead of round-tripping through Vector3
+            x1, y1, z1 = collider1.game_object.position
+            x2, y2, z2 = collider2.game_object.position
+            dx, dy, dz = x1 - x2, y1 - y2, z1 - z2
+            distance = math.sqrt(dx * dx + dy * dy + dz * dz)
             
             if distance == 0:
                 # If objects are at the same position, push in a random direction
-                direction = Vector3(1, 0, 0)
+                dx, dy, dz = 1.0, 0.0, 0.0
                 distance = 1
             
             overlap = (collider1.radius + collider2.radius) - distance
             
             if overlap > 0:
-                # Push objects apart
-                direction = direction.normalize()
-                push_vector = direction * (overlap * 0.5)
-                
-                # Update positions
-                pos1 = Vector3.from_tuple(collider1.game_object.position) + push_vector
-                pos2 = Vector3.from_tuple(collider2.game_object.position) - push_vector
+                # Push objects apart along the normalized direction
+                scale = overlap * 0.5 / distance
+                px, py, pz = dx * scale, dy * scale, dz * scale
                 
-                collider1.game_object.position = pos1.to_tuple()
-                collider2.game_object.position = pos2.to_tuple()
\ No newline at end of file
+                collider1.game_object.position = (x1 + px, y1 + py, z1 + pz)
+                collider2.game_object.position = (x2 - px, y2 - py, z2 - pz)
+    
+    def _resolve_sphere_collisions(self, pairs: np.ndarray):
+        """Push overlapping sphere pairs apart in a single vectorized pass
+        
+        pairs is an (M, 2) array of collider indices. Every push is computed
+        from the positions at the start of the pass and accumulated with
+        np.add.at, so an object in several contacts receives all of its pushes.
+        """
+        colliders = self.colliders
+        involved, local = np.unique(pairs, return_inverse=True)
+        local = local.reshape(pairs.shape)
+        a, b = local[:, 0], local[:, 1]
+        
+        objects = [colliders[k].game_object for k in involved.tolist()]
+        positions = np.array([obj.position for obj in objects], dtype=np.float64).reshape(-1, 3)
+        radii = np.fromiter((colliders[k].radius for k in involved.tolist()),
+                            dtype=np.float64, count=len(involved))
+        
+        direction = positions[a] - positions[b]
+        distance = np.sqrt(np.einsum("ij,ij->i", direction, direction))
+        
+        # If objects are at the same position, push along +X
+        coincident = distance == 0
+        direction[coincident] = (1.0, 0.0, 0.0)
+        distance[coincident] = 1.0
+        
+        overlap = (radii[a] + radii[b]) - distance
+        keep = overlap > 0
+        if not keep.any():
+            return
+        a, b = a[keep], b[keep]
+        push = direction[keep] * (overlap[keep] * 0.5 / distance[keep])[:, None]
+        
+        np.add.at(positions, a, push)
+        np.subtract.at(positions, b, push)
+        
+        # Write back only the objects that actually moved
+        for k in np.unique(np.concatenate((a, b))).tolist():
+            objects[k].position = tuple(positions[k].tolist())
@@ -5,11 +5,42 @@ Procedural Level Generation System for MCP Games
 import random
 import math
 import logging
+import itertools
+from bisect import bisect_left
 from typing import Dict, List, Any, Optional, Tuple, Set, Callable
 from dataclasses import dataclass
 
+import numpy as np
+
+try:
+    from numba import njit
+except ImportError:  # Numba is optional; rooms are placed in pure Python without it
+    njit = None
+
 from .physics import Vector3
 
+# Room counts from which pairwise MST edges are computed with NumPy; smaller
+# levels are cheaper in plain Python than the array setup
+VECTORIZED_EDGES_MIN_ROOMS = 24
+# Room counts from which the MST is built with Prim's algorithm instead of
+# sorting every pairwise edge
+PRIM_MIN_ROOMS = 256
+# Nearest neighbours per room considered for extra (loop) corridors on that path
+LOOP_CANDIDATE_NEIGHBORS = 8
+# Room counts from which the Python sampler narrows overlap tests with a
+# spatial hash; below it, testing against every room in one array op is faster
+ROOM_GRID_MIN_ROOMS = 256
+
+# Render colors per room type
+_DEFAULT_COLOR = (200, 200, 200)  # Light gray
+_ROOM_COLORS = {
+    "default": _DEFAULT_COLOR,
+    "treasure": (255, 215, 0),   # Gold
+    "enemy": (200, 0, 0),        # Red
+    "boss": (128, 0, 128),       # Purple
+    "shop": (0, 128, 128)        # Teal
+}
+
 @dataclass
 class Room:
     """Represents a room in a procedural level"""
@@ -23,6 +54,11 @@ class Room:
     def __post_init__(self):
         if self.connections is None:
             self.connections = []
+        
+        # Cache half extents; rooms are not resized after creation
+        self._hw = self.width / 2
+        self._hh = self.height / 2
+        self._hd = self.depth / 2
     
     @property
     def center(self) -> Vector3:
@@ -32,44 +68,31 @@ class Room:
     @property
     def min_bounds(self) -> Vector3:
         """Get the minimum bounds of the room"""
-        half_width = self.width / 2
-        half_height = self.height / 2
-        half_depth = self.depth / 2
         return Vector3(
-            self.position.x - half_width,
-            self.position.y - half_height,
-            self.position.z - half_depth
+            self.position.x - self._hw,
+            self.position.y - self._hh,
+            self.position.z - self._hd
         )
     
     @property
     def max_bounds(self) -> Vector3:
         """Get the maximum bounds of the room"""
-        half_width = self.width / 2
-        half_height = self.height / 2
-        half_depth = self.depth / 2
         return Vector3(
-            self.position.x + half_width,
-            self.position.y + half_height,
-            self.position.z + half_depth
+            self.position.x + self._hw,
+            self.position.y + self._hh,
+            self.position.z + self._hd
         )
     
     def intersects(self, other: 'Room', buffer: float = 1.0) -> bool:
         """Check if this room intersects with another room"""
-        # Add buffer to avoid rooms being too close
-        min_a = self.min_bounds
-        max_a = self.max_bounds
-        min_b = other.min_bounds
-        max_b = other.max_bounds
-        
-        # Adjust bounds with buffer
-        min_a = Vector3(min_a.x - buffer, min_a.y - buffer, min_a.z - buffer)
-        max_a = Vector3(max_a.x + buffer, max_a.y + buffer, max_a.z + buffer)
-        
-        # Check for intersection
+        # Separating-axis test on center offsets, with a buffer to avoid rooms
+        # being too close; no intermediate Vector3 bounds are built. The wide
+        # X/Z axes reject most pairs, so they are checked before the short Y axis
+        a, b = self.position, other.position
         return (
-            min_a.x <= max_b.x and max_a.x >= min_b.x and
-            min_a.y <= max_b.y and max_a.y >= min_b.y and
-            min_a.z <= max_b.z and max_a.z >= min_b.z
+            abs(a.x - b.x) <= self._hw + other._hw + buffer and
+            abs(a.z - b.z) <= self._hd + other._hd + buffer and
+            abs(a.y - b.y) <= self._hh + other._hh + buffer
         )
     
     def distance_to(self, other: 'Room') -> float:
@@ -84,11 +107,148 @@ class Corridor:
     end_room_idx: int
     width: float = 2.0
     height: float = 3.0
-    path_points: List[Vector3] = None
+    path_points: np.ndarray = None  # (P, 3) float32 polyline
     
     def __post_init__(self):
         if self.path_points is None:
-            self.path_points = []
+            self.path_points = np.empty((0, 3), dtype=np.float32)
+
+
+def _place_rooms(centers, halves, num_rooms, buffer):
+    """Accept candidate rooms in order unless they overlap an accepted room
+    
+    centers and halves are the (A, 3) candidate centers and half extents.
+    Returns the indices of the accepted candidates and the number of attempts
+    used. Written in the numba subset so it can be compiled with njit; the
+    candidates are drawn outside, so both paths place the same rooms.
+    """
+    accepted = np.empty(num_rooms, dtype=np.int64)
+    count = 0
+    attempts = 0
+    
+    while count < num_rooms and attempts < len(centers):
+        # Same test as _overlaps_any against every accepted room
+        overlaps = False
+        for k in range(count):
+            a = accepted[k]
+            if (abs(centers[attempts, 0] - centers[a, 0]) <= halves[attempts, 0] + halves[a, 0] + buffer and
+                    abs(centers[attempts, 2] - centers[a, 2]) <= halves[attempts, 2] + halves[a, 2] + buffer and
+                    abs(centers[attempts, 1] - centers[a, 1]) <= halves[attempts, 1] + halves[a, 1] + buffer):
+                overlaps = True
+                break
+        
+        if not overlaps:
+            accepted[count] = attempts
+            count += 1
+        
+        attempts += 1
+    
+    return accepted[:count], attempts
+
+
+_place_rooms_jit = njit(cache=True)(_place_rooms) if njit is not None else None
+
+
+def _overlaps_any(pos: np.ndarray, half: np.ndarray, center: np.ndarray, half_ext: np.ndarray,
+                  buffer: float) -> bool:
+    """Branchless AABB test of one room against many (same test as Room.intersects)"""
+    return bool((np.abs(center - pos) <= half_ext + half + buffer).all(axis=1).any())
+
+
+def _sorted_edges(centers: np.ndarray) -> List[Tuple[int, int]]:
+    """All pairwise edges (i, j), i < j, sorted by center distance"""
+    # Condensed pairwise distances in i < j order, like scipy's pdist
+    n = len(centers)
+    i_idx, j_idx = (idx.astype(np.int32) for idx in np.triu_indices(n, 1))
+    delta = centers[i_idx] - centers[j_idx]
+    dist_sq = np.einsum("ij,ij->i", delta, delta)
+    
+    # Sort edges by squared distance on the flat array; the order is the same
+    # as for true distances (stable, so ties keep i < j order)
+    order = np.argsort(dist_sq, kind="stable")
+    return list(zip(i_idx[order].tolist(), j_idx[order].tolist()))
+
+
+def _sorted_edges_python(points: List[Tuple[float, float, float]]) -> List[Tuple[int, int]]:
+    """Pure Python _sorted_edges for small levels, in the same order"""
+    edges = []
+    for i, (xi, yi, zi) in enumerate(points):
+        for j in range(i + 1, len(points)):
+            xj, yj, zj = points[j]
+            dx, dy, dz = xi - xj, yi - yj, zi - zj
+            edges.append((dx * dx + dy * dy + dz * dz, i, j))
+    edges.sort()
+    return [(i, j) for _, i, j in edges]
+
+
+def _kruskal_mst(n: int, edges: List[Tuple[int, int]]) -> List[Tuple[int, int]]:
+    """Build the MST of n rooms from edges in distance order (Kruskal's algorithm)"""
+    # Disjoint sets with iterative path compression and union by rank
+    parent = list(range(n))
+    rank = [0] * n
+    
+    def find(x):
+        root = x
+        while parent[root] != root:
+            root = parent[root]
+        while parent[x] != root:
+            parent[x], x = root, parent[x]
+        return root
+    
+    mst_edges = []
+    for i, j in edges:
+        root_i, root_j = find(i), find(j)
+        if root_i != root_j:
+            # Attach the shallower tree under the deeper one
+            if rank[root_i] < rank[root_j]:
+                root_i, root_j = root_j, root_i
+            parent[root_j] = root_i
+            if rank[root_i] == rank[root_j]:
+                rank[root_i] += 1
+            mst_edges.append((i, j))
+            if len(mst_edges) == n - 1:
+                break
+    
+    return mst_edges
+
+
+def _prim_mst(centers: np.ndarray, neighbors: int) -> Tuple[List[Tuple[int, int]], List[Tuple[int, int]]]:
+    """Build the MST with array-based Prim, without materializing the edge list
+    
+    Uses O(N) memory instead of O(N^2). Besides the MST edges (sorted by
+    distance, like Kruskal's) it returns the k-nearest-neighbour edges of each
+    room in distance order, as loop corridor candidates.
+    """
+    n = len(centers)
+    k = min(neighbors + 1, n)  # The nearest "neighbour" is the room itself
+    in_tree = np.zeros(n, dtype=bool)
+    best_dist = np.full(n, np.inf)
+    best_from = np.zeros(n, dtype=np.int64)
+    
+    mst_edges = []
+    candidates = {}
+    node = 0
+    for _ in range(n - 1):
+        in_tree[node] = True
+        delta = centers - centers[node]
+        dist = np.einsum("ij,ij->i", delta, delta)  # Squared; only the order matters
+        
+        for j in np.argpartition(dist, k - 1)[:k].tolist():
+            if j != node:
+                candidates[(min(node, j), max(node, j))] = dist[j]
+        
+        # Relax the frontier with edges from the newly added room
+        closer = ~in_tree & (dist < best_dist)
+        best_dist[closer] = dist[closer]
+        best_from[closer] = node
+        
+        node = int(np.argmin(np.where(in_tree, np.inf, best_dist)))
+        other = int(best_from[node])
+        mst_edges.append((best_dist[node], min(node, other), max(node, other)))
+    
+    mst_edges.sort()
+    loop_edges = sorted((d, i, j) for (i, j), d in candidates.items())
+    return [(i, j) for _, i, j in mst_edges], [(i, j) for _, i, j in loop_edges]
 
 
 class ProceduralLevelGenerator:
@@ -100,6 +260,14 @@ class ProceduralLevelGenerator:
         self.corridors: List[Corridor] = []
         self.logger = logging.getLogger("mcp_games.engine.procedural")
         
+        # Structure-of-arrays copy of the rooms used by the generation hot paths
+        self._pos = np.empty((0, 3))   # Room centers
+        self._half = np.empty((0, 3))  # Room half extents
+        self._type: List[str] = []
+        
+        # Vectorized random draws; reseeded from random for every generated level
+        self._rng = np.random.default_rng()
+        
         # Default room types and their probabilities
         self.room_types = {
             "default": 0.5,
@@ -146,87 +314,160 @@ class ProceduralLevelGenerator:
     
     def _generate_rooms(self, num_rooms: int):
         """Generate random rooms"""
-        attempts = 0
         max_attempts = num_rooms * 10  # Limit attempts to avoid infinite loops
         
-        while len(self.rooms) < num_rooms and attempts < max_attempts:
-            # Generate random room size
-            width = random.uniform(self.min_room_size, self.max_room_size)
-            height = random.uniform(self.min_room_size / 2, self.max_room_size / 2)
-            depth = random.uniform(self.min_room_size, self.max_room_size)
-            
-            # Generate random position within level bounds
-            min_bounds, max_bounds = self.level_bounds
-            x = random.uniform(min_bounds.x + width/2, max_bounds.x - width/2)
-            y = random.uniform(min_bounds.y + height/2, max_bounds.y - height/2)
-            z = random.uniform(min_bounds.z + depth/2, max_bounds.z - depth/2)
-            
-            position = Vector3(x, y, z)
-            
-            # Select room type based on probabilities
-            room_type = self._select_room_type()
-            
-            # Create new room
-            new_room = Room(position, width, height, depth, room_type)
-            
-            # Check for intersections with existing rooms
-            if not any(new_room.intersects(room) for room in self.rooms):
-                self.rooms.append(new_room)
-                self.logger.debug(f"Added {room_type} room at {position}")
-            
-            attempts += 1
+        # Seeded from random so random.seed() still reproduces levels
+        self._rng = np.random.default_rng(random.getrandbits(32))
+        
+        # Draw every candidate room size and position up front, so the compiled
+        # and Python samplers see the same stream and place the same rooms
+        min_bounds, max_bounds = self.level_bounds
+        sizes = self._rng.uniform(
+            (self.min_room_size, self.min_room_size / 2, self.min_room_size),
+            (self.max_room_size, self.max_room_size / 2, self.max_room_size),
+            size=(max_attempts, 3)
+        )
+        halves = sizes / 2
+        centers = self._rng.uniform(np.array(min_bounds.to_tuple()) + halves,
+                                    np.array(max_bounds.to_tuple()) - halves)
+        
+        if _place_rooms_jit is not None:
+            accepted, attempts = _place_rooms_jit(centers, halves, num_rooms, 1.0)
+        else:
+            accepted, attempts = self._place_rooms_python(centers, halves, num_rooms)
+        
+        # Room types are only drawn for the rooms that were accepted
+        self._set_rooms(centers[accepted], halves[accepted], self._select_room_types(len(accepted)))
         
         if attempts >= max_attempts:
             self.logger.warning(f"Reached maximum attempts ({max_attempts}) when generating rooms")
     
-    def _select_room_type(self) -> str:
-        """Select a room type based on probabilities"""
-        r = random.random()
-        cumulative = 0
+    def _place_rooms_python(self, centers: np.ndarray, halves: np.ndarray,
+                            num_rooms: int) -> Tuple[np.ndarray, int]:
+        """Python version of _place_rooms; returns accepted candidate indices and attempts used"""
+        max_attempts = len(centers)
+        attempts = 0
+        count = 0
+        accepted = np.empty(num_rooms, dtype=np.int64)
+        pos = np.empty((num_rooms, 3))
+        half = np.empty((num_rooms, 3))
+        
+        # Uniform grid of accepted room indices, so a candidate is only tested
+        # against rooms in the cells it covers (large levels only)
+        buffer = 1.0
+        use_grid = num_rooms >= ROOM_GRID_MIN_ROOMS
+        cell_size = self.max_room_size + 2 * buffer
+        grid: Dict[Tuple[int, int, int], List[int]] = {}
+        
+        def covered_cells(x, y, z, hw, hh, hd, margin):
+            return itertools.product(
+                range(math.floor((x - hw - margin) / cell_size), math.floor((x + hw + margin) / cell_size) + 1),
+                range(math.floor((y - hh - margin) / cell_size), math.floor((y + hh + margin) / cell_size) + 1),
+                range(math.floor((z - hd - margin) / cell_size), math.floor((z + hd + margin) / cell_size) + 1)
+            )
         
-        for room_type, probability in self.room_types.items():
-            cumulative += probability
-            if r <= cumulative:
-                return room_type
+        while count < num_rooms and attempts < max_attempts:
+            center = centers[attempts]
+            half_ext = halves[attempts]
+            
+            # Check for intersections with existing rooms, all in one array op
+            if use_grid:
+                x, y, z = center.tolist()
+                hw, hh, hd = half_ext.tolist()
+                nearby = list({idx for cell in covered_cells(x, y, z, hw, hh, hd, 0.0) for idx in grid.get(cell, ())})
+                overlaps = _overlaps_any(pos[nearby], half[nearby], center, half_ext, buffer)
+            else:
+                overlaps = _overlaps_any(pos[:count], half[:count], center, half_ext, buffer)
+            
+            if not overlaps:
+                if use_grid:
+                    # Register the room in every cell its buffered bounds touch
+                    for cell in covered_cells(x, y, z, hw, hh, hd, buffer):
+                        grid.setdefault(cell, []).append(count)
+                pos[count] = center
+                half[count] = half_ext
+                accepted[count] = attempts
+                count += 1
+            
+            attempts += 1
         
-        # Default fallback
-        return "default"
+        return accepted[:count], attempts
+    
+    def _set_rooms(self, pos: np.ndarray, half: np.ndarray, types: List[str]):
+        """Store generated rooms as arrays and build the matching Room objects"""
+        self._pos = pos
+        self._half = half
+        self._type = types
+        
+        for (x, y, z), (hw, hh, hd), room_type in zip(pos.tolist(), half.tolist(), types):
+            self.rooms.append(Room(Vector3(x, y, z), hw * 2, hh * 2, hd * 2, room_type))
+            self.logger.debug(f"Added {room_type} room at {self.rooms[-1].position}")
+    
+    def _sync_room_arrays(self):
+        """Rebuild the room arrays from the current Room objects"""
+        self._pos = np.array([r.position.to_tuple() for r in self.rooms], dtype=np.float64).reshape(-1, 3)
+        self._half = np.array([(r._hw, r._hh, r._hd) for r in self.rooms], dtype=np.float64).reshape(-1, 3)
+        self._type = [r.room_type for r in self.rooms]
+    
+    @property
+    def room_types(self) -> Dict[str, float]:
+        """Room types and their probabilities"""
+        return self._room_types
+    
+    @room_types.setter
+    def room_types(self, room_types: Dict[str, float]):
+        self._room_types = room_types
+        self._rebuild_type_cdf()
+    
+    def _rebuild_type_cdf(self):
+        """Precompute the cumulative distribution used to sample room types"""
+        self._type_snapshot = list(self._room_types.items())
+        self._type_names = list(self._room_types.keys()) + ["default"]  # Last entry is the fallback
+        self._type_cumprobs = np.cumsum(list(self._room_types.values()), dtype=np.float64).tolist()
+    
+    def _refresh_type_cdf(self):
+        """Rebuild the distribution if room_types was edited in place"""
+        if list(self._room_types.items()) != self._type_snapshot:
+            self._rebuild_type_cdf()
+    
+    def _select_room_type(self) -> str:
+        """Select a room type based on probabilities"""
+        self._refresh_type_cdf()
+        return self._type_names[bisect_left(self._type_cumprobs, random.random())]
+    
+    def _select_room_types(self, count: int) -> List[str]:
+        """Select several room types in one vectorized draw"""
+        self._refresh_type_cdf()
+        draws = self._rng.random(count)
+        indices = np.searchsorted(self._type_cumprobs, draws, side="left")
+        return [self._type_names[idx] for idx in indices.tolist()]
     
     def _connect_rooms(self):
         """Connect rooms with corridors using minimum spanning tree"""
         if len(self.rooms) < 2:
             return
         
-        # Calculate distances between all rooms
-        edges = []
-        for i in range(len(self.rooms)):
-            for j in range(i+1, len(self.rooms)):
-                distance = self.rooms[i].distance_to(self.rooms[j])
-                edges.append((i, j, distance))
-        
-        # Sort edges by distance
-        edges.sort(key=lambda x: x[2])
-        
-        # Minimum spanning tree (Kruskal's algorithm)
-        parent = list(range(len(self.rooms)))
-        
-        def find(x):
-            if parent[x] != x:
-                parent[x] = find(parent[x])
-            return parent[x]
-        
-        def union(x, y):
-            parent[find(x)] = find(y)
-        
-        mst_edges = []
-        for i, j, _ in edges:
-            if find(i) != find(j):
-                union(i, j)
-                mst_edges.append((i, j))
-                
-                # Add connection to rooms
-                self.rooms[i].connections.append(j)
-                self.rooms[j].connections.append(i)
+        # Rooms may have been replaced or moved since they were generated, so
+        # the arrays are always rebuilt from the Room objects; this is O(N)
+        self._sync_room_arrays()
+        centers = self._pos
+        
+        # Minimum spanning tree, plus candidate edges in distance order
+        num_rooms = len(self.rooms)
+        if num_rooms >= PRIM_MIN_ROOMS:
+            mst_edges, candidate_edges = _prim_mst(centers, LOOP_CANDIDATE_NEIGHBORS)
+        else:
+            if num_rooms >= VECTORIZED_EDGES_MIN_ROOMS:
+                candidate_edges = _sorted_edges(centers)
+            else:
+                candidate_edges = _sorted_edges_python(centers.tolist())
+            mst_edges = _kruskal_mst(num_rooms, candidate_edges)
+        mst_set = set(mst_edges)  # Edges are stored as (i, j) with i < j
+        
+        for i, j in mst_edges:
+            # Add connection to rooms
+            self.rooms[i].connections.append(j)
+            self.rooms[j].connections.append(i)
         
         # Create corridors for MST edges
         for start_idx, end_idx in mst_edges:
@@ -235,12 +476,13 @@ class ProceduralLevelGenerator:
         
         # Add some additional corridors for loops (about 10% of MST edges)
         num_extra = max(1, int(len(mst_edges) * 0.1))
-        extra_edges = [e for e in edges if (e[0], e[1]) not in mst_edges and (e[1], e[0]) not in mst_edges]
+        # Edges are already in distance order, so the shortest non-MST edges
+        # are simply the first ones not in the tree
+        extra_edges = list(itertools.islice(
+            ((i, j) for i, j in candidate_edges if (i, j) not in mst_set), num_extra))
         
         if extra_edges:
-            extra_edges = sorted(extra_edges, key=lambda x: x[2])[:num_extra]
-            
-            for i, j, _ in extra_edges:
+            for i, j in extra_edges:
                 corridor = self._create_corridor(i, j)
                 self.corridors.append(corridor)
                 
@@ -261,17 +503,12 @@ class ProceduralLevelGenerator:
         end_pos = end_room.center
         
         # Simple L-shaped path
-        # First go along X axis
-        mid_x = end_pos.x
-        mid_y = start_pos.y
-        mid_z = start_pos.z
-        
-        # Then go along Z axis
-        corridor.path_points = [
-            start_pos,
-            Vector3(mid_x, mid_y, mid_z),
-            end_pos
-        ]
+        # First go along X axis, then along Z axis
+        corridor.path_points = np.array([
+            [start_pos.x, start_pos.y, start_pos.z],
+            [end_pos.x, start_pos.y, start_pos.z],
+            [end_pos.x, end_pos.y, end_pos.z]
+        ], dtype=np.float32)
         
         return corridor
     
@@ -292,21 +529,11 @@ class ProceduralLevelGenerator:
         
         # Instantiate rooms
         for i, room in enumerate(self.rooms):
-            # Create room object
-            room_id = f"room_{i}"
-            room_obj = engine.GameObject(room_id, f"room_{room.room_type}")
-            room_obj.position = room.center.to_tuple()
+            room_obj = self._make_object(engine, f"room_{i}", f"room_{room.room_type}", room.center.to_tuple())
             
-            # Add to engine
-            engine.add_object(room_obj)
-            
-            # Add collider for walls
-            engine.add_collider(room_obj, "box", size=Vector3(room.width, room.height, room.depth))
-            
-            # Add render component based on room type
-            color = self._get_room_color(room.room_type)
-            render_comp = engine.add_render_component(room_obj)
-            render_comp.set_color(color)
+            # Box collider for the walls, colored by room type
+            self._add_to_engine(engine, room_obj, "box", {"size": Vector3(room.width, room.height, room.depth)},
+                                self._get_room_color(room.room_type))
             
             created_objects["rooms"].append(room_obj)
             
@@ -316,52 +543,46 @@ class ProceduralLevelGenerator:
         
         # Instantiate corridors
         for i, corridor in enumerate(self.corridors):
+            # Segment midpoints and directions for the whole path at once
+            points = corridor.path_points
+            mids = ((points[:-1] + points[1:]) * 0.5).tolist()
+            directions = np.abs(np.diff(points, axis=0)).tolist()
+            
             # Create corridor segments
-            for j in range(len(corridor.path_points) - 1):
-                start = corridor.path_points[j]
-                end = corridor.path_points[j + 1]
-                
-                # Calculate midpoint and dimensions
-                mid = (start + end) / 2
-                
-                # Calculate length and direction
-                direction = end - start
-                length = direction.magnitude()
-                
+            for j, (mid, (dx, _, dz)) in enumerate(zip(mids, directions)):
                 # Create corridor segment
                 corridor_id = f"corridor_{i}_{j}"
-                corridor_obj = engine.GameObject(corridor_id, "corridor")
-                corridor_obj.position = mid.to_tuple()
+                corridor_obj = self._make_object(engine, corridor_id, "corridor", tuple(mid))
                 
-                # Add to engine
-                engine.add_object(corridor_obj)
-                
-                # Add collider
-                engine.add_collider(corridor_obj, "box", 
-                                   size=Vector3(
-                                       max(corridor.width, abs(direction.x)),
-                                       corridor.height,
-                                       max(corridor.width, abs(direction.z))
-                                   ))
-                
-                # Add render component
-                render_comp = engine.add_render_component(corridor_obj)
-                render_comp.set_color((100, 100, 100))  # Gray corridors
+                size = Vector3(max(corridor.width, dx), corridor.height, max(corridor.width, dz))
+                self._add_to_engine(engine, corridor_obj, "box", {"size": size}, (100, 100, 100))  # Gray corridors
                 
                 created_objects["corridors"].append(corridor_obj)
         
         return created_objects
     
-    def _get_room_color(self, room_type: str) -> Tuple[int, int, int]:
-        """Get color for room based on type"""
-        colors = {
-            "default": (200, 200, 200),  # Light gray
-            "treasure": (255, 215, 0),   # Gold
-            "enemy": (200, 0, 0),        # Red
-            "boss": (128, 0, 128),       # Purple
-            "shop": (0, 128, 128)        # Teal
-        }
-        return colors.get(room_type, (200, 200, 200))
+    @staticmethod
+    def _add_to_engine(engine: Any, obj: Any, collider_type: str, collider_args: Dict[str, Any],
+                       color: Tuple[int, int, int], scale: Optional[float] = None):
+        """Add an object to the engine with a collider and a colored render component"""
+        engine.add_object(obj)
+        engine.add_collider(obj, collider_type, **collider_args)
+        render_comp = engine.add_render_component(obj)
+        render_comp.set_color(color)
+        if scale is not None:
+            render_comp.set_scale(scale)
+    
+    @staticmethod
+    def _make_object(engine: Any, object_id: str, object_type: str, position: Tuple[float, float, float]) -> Any:
+        """Create an engine GameObject already placed at position"""
+        game_object = engine.GameObject(object_id, object_type)
+        game_object.position = position
+        return game_object
+    
+    @staticmethod
+    def _get_room_color(room_type: str) -> Tuple[int, int, int]:
+        """Get color for room based on type (always the same tuple object per type)"""
+        return _ROOM_COLORS.get(room_type, _DEFAULT_COLOR)
     
     def _add_room_decorations(self, engine: Any, room: Room, room_obj: Any) -> List[Any]:
         """Add decorations to a room based on its type"""
@@ -375,18 +596,10 @@ class ProceduralLevelGenerator:
         if room.room_type == "treasure":
             # Add treasure chest in center
             chest_id = f"chest_{room_obj.id}"
-            chest = engine.GameObject(chest_id, "treasure_chest")
-            chest.position = room.center.to_tuple()
-            
-            # Add to engine
-            engine.add_object(chest)
+            chest = self._make_object(engine, chest_id, "treasure_chest", room.center.to_tuple())
             
-            # Add collider
-            engine.add_collider(chest, "box", size=Vector3(1.0, 1.0, 1.0))
-            
-            # Add render component
-            render_comp = engine.add_render_component(chest)
-            render_comp.set_color((255, 215, 0))  # Gold
+            # Gold box
+            self._add_to_engine(engine, chest, "box", {"size": Vector3(1.0, 1.0, 1.0)}, (255, 215, 0))
             
             decorations.append(chest)
             
@@ -396,85 +609,53 @@ class ProceduralLevelGenerator:
             
             for i in range(num_enemies):
                 enemy_id = f"enemy_{room_obj.id}_{i}"
-                enemy = engine.GameObject(enemy_id, "enemy")
                 
                 # Random position within room
                 x = random.uniform(min_bounds.x + 1, max_bounds.x - 1)
                 z = random.uniform(min_bounds.z + 1, max_bounds.z - 1)
-                enemy.position = (x, room.center.y, z)
-                
-                # Add to engine
-                engine.add_object(enemy)
-                
-                # Add collider
-                engine.add_collider(enemy, "sphere", radius=0.5)
+                enemy = self._make_object(engine, enemy_id, "enemy", (x, room.center.y, z))
                 
-                # Add render component
-                render_comp = engine.add_render_component(enemy)
-                render_comp.set_color((200, 0, 0))  # Red
+                # Red sphere
+                self._add_to_engine(engine, enemy, "sphere", {"radius": 0.5}, (200, 0, 0))
                 
                 decorations.append(enemy)
                 
         elif room.room_type == "boss":
             # Add boss in center
             boss_id = f"boss_{room_obj.id}"
-            boss = engine.GameObject(boss_id, "boss")
-            boss.position = room.center.to_tuple()
+            boss = self._make_object(engine, boss_id, "boss", room.center.to_tuple())
             
-            # Add to engine
-            engine.add_object(boss)
-            
-            # Add collider
-            engine.add_collider(boss, "sphere", radius=1.5)
-            
-            # Add render component
-            render_comp = engine.add_render_component(boss)
-            render_comp.set_color((128, 0, 128))  # Purple
-            render_comp.set_scale(2.0)
+            # Purple sphere
+            self._add_to_engine(engine, boss, "sphere", {"radius": 1.5}, (128, 0, 128), 2.0)
             
             decorations.append(boss)
             
         elif room.room_type == "shop":
             # Add shopkeeper
             shop_id = f"shopkeeper_{room_obj.id}"
-            shopkeeper = engine.GameObject(shop_id, "shopkeeper")
-            shopkeeper.position = room.center.to_tuple()
-            
-            # Add to engine
-            engine.add_object(shopkeeper)
+            shopkeeper = self._make_object(engine, shop_id, "shopkeeper", room.center.to_tuple())
             
-            # Add collider
-            engine.add_collider(shopkeeper, "sphere", radius=0.5)
-            
-            # Add render component
-            render_comp = engine.add_render_component(shopkeeper)
-            render_comp.set_color((0, 128, 128))  # Teal
+            # Teal sphere
+            self._add_to_engine(engine, shopkeeper, "sphere", {"radius": 0.5}, (0, 128, 128))
             
             decorations.append(shopkeeper)
             
             # Add some items for sale
             num_items = random.randint(2, 4)
             
-            for i in range(num_items):
+            # Positions in a circle around shopkeeper
+            center = room.center
+            radius = 2.0
+            angles = np.linspace(0.0, 2 * np.pi, num_items, endpoint=False)
+            xs = (center.x + radius * np.cos(angles)).tolist()
+            zs = (center.z + radius * np.sin(angles)).tolist()
+            
+            for i, (x, z) in enumerate(zip(xs, zs)):
                 item_id = f"item_{room_obj.id}_{i}"
-                item = engine.GameObject(item_id, "shop_item")
-                
-                # Position in a circle around shopkeeper
-                angle = (i / num_items) * 2 * math.pi
-                radius = 2.0
-                x = room.center.x + math.cos(angle) * radius
-                z = room.center.z + math.sin(angle) * radius
-                item.position = (x, room.center.y, z)
-                
-                # Add to engine
-                engine.add_object(item)
-                
-                # Add collider
-                engine.add_collider(item, "box", size=Vector3(0.5, 0.5, 0.5))
+                item = self._make_object(engine, item_id, "shop_item", (x, center.y, z))
                 
-                # Add render component
-                render_comp = engine.add_render_component(item)
-                render_comp.set_color((0, 200, 200))  # Light teal
+                # Light teal box
+                self._add_to_engine(engine, item, "box", {"size": Vector3(0.5, 0.5, 0.5)}, (0, 200, 200))
                 
                 decorations.append(item)
         
@@ -4,12 +4,189 @@ Rendering System for MCP Games using Pygame
 
 import os
 import math
+import time
+import weakref
+from collections import OrderedDict
+from functools import lru_cache
+from itertools import compress
+from operator import attrgetter
+import numpy as np
 import pygame
-from typing import Dict, List, Tuple, Any, Optional
+from typing import Dict, List, Tuple, Any, Optional, Callable
 from .physics import Vector3
 
-# Initialize pygame
-pygame.init()
+try:
+    from numba import njit
+except ImportError:  # Numba is optional; particles are updated with NumPy array ops without it
+    njit = None
+
+# Particles store an index into their system's palette; the default is
+# 16 warm oranges covering the old random color range
+DEFAULT_PARTICLE_PALETTE = np.array(
+    [(228, g, b) for g in (112, 137, 163, 188) for b in (12, 37, 63, 88)], dtype=np.uint8
+)
+# Particle sprites are pre-rendered per palette entry, alpha level and radius
+PARTICLE_ALPHA_LEVELS = 8
+PARTICLE_MAX_RADIUS = 8
+# Particle sprite tables kept before the cache is reset
+PARTICLE_TABLE_CACHE_SIZE = 16
+# Dead particles are left in place until they make up this fraction of the
+# used slots, then compacted away in one pass
+PARTICLE_COMPACT_FRACTION = 0.25
+# Particle velocities are stored as int16 in thousandths of a unit per second,
+# which covers speeds up to about 32 units per second
+PARTICLE_VELOCITY_SCALE = 1000
+
+# Debug HUD text surfaces kept before the cache is reset
+HUD_CACHE_SIZE = 64
+
+# Scaled sprite images kept for sharing between sprites
+SPRITE_CACHE_SIZE = 256
+
+# Loaded sprite images kept; sprites hold on to their own image, so eviction
+# only means a later sprite reloads the file
+IMAGE_CACHE_SIZE = 256
+
+# Pre-rendered circle surfaces kept; one particle palette alone uses
+# palette size * PARTICLE_ALPHA_LEVELS * PARTICLE_MAX_RADIUS of them
+CIRCLE_CACHE_SIZE = 4096
+
+# Loaded sprite images shared between sprites, keyed by file path and kept in
+# least recently used order. Images loaded before a display mode is set cannot
+# be converted yet; their paths and the sprites using them are kept until the
+# first RenderSystem exists.
+_image_cache: Dict[str, pygame.Surface] = OrderedDict()
+_unconverted_paths: set = set()
+_unconverted_sprites = weakref.WeakSet()
+
+
+def _step_particles(positions, velocities, ages, lifetimes, alive, delta_time, step):
+    """Integrate, age and life-test particles in one fused pass
+    
+    step is delta_time divided by PARTICLE_VELOCITY_SCALE, passed in so the
+    kernel stays in float32. Written in the numba subset so it can be
+    compiled with njit.
+    """
+    for i in range(positions.shape[0]):
+        positions[i, 0] += velocities[i, 0] * step
+        positions[i, 1] += velocities[i, 1] * step
+        positions[i, 2] += velocities[i, 2] * step
+        ages[i] += delta_time
+        alive[i] = ages[i] < lifetimes[i]
+
+
+# Visual particles do not need strict IEEE semantics, so fastmath is fine
+_step_particles_jit = (njit(fastmath=True, cache=True)(_step_particles)
+                       if njit is not None else None)
+
+if _step_particles_jit is not None:
+    # Compile up front so the first frame with particles does not hitch
+    _step_particles_jit(np.zeros((1, 3), dtype=np.float32), np.zeros((1, 3), dtype=np.int16),
+                        np.zeros(1, dtype=np.float32), np.ones(1, dtype=np.float32),
+                        np.zeros(1, dtype=np.bool_), np.float32(0.0), np.float32(0.0))
+
+def _compact_particles(positions, velocities, color_indices, sizes, ages, lifetimes, alive, count):
+    """Remove dead particles by moving the last live one into each hole
+    
+    Work is proportional to the number of dead particles; order is not kept.
+    Returns the new live count. Written in the numba subset.
+    """
+    i = 0
+    while i < count:
+        if alive[i]:
+            i += 1
+            continue
+        count -= 1
+        positions[i, 0] = positions[count, 0]
+        positions[i, 1] = positions[count, 1]
+        positions[i, 2] = positions[count, 2]
+        velocities[i, 0] = velocities[count, 0]
+        velocities[i, 1] = velocities[count, 1]
+        velocities[i, 2] = velocities[count, 2]
+        color_indices[i] = color_indices[count]
+        sizes[i] = sizes[count]
+        ages[i] = ages[count]
+        lifetimes[i] = lifetimes[count]
+        alive[i] = alive[count]
+    return count
+
+
+_compact_particles_jit = njit(cache=True)(_compact_particles) if njit is not None else None
+
+if _compact_particles_jit is not None:
+    _compact_particles_jit(np.zeros((1, 3), dtype=np.float32), np.zeros((1, 3), dtype=np.int16),
+                           np.zeros(1, dtype=np.uint8), np.zeros(1, dtype=np.uint8),
+                           np.zeros(1, dtype=np.float32), np.ones(1, dtype=np.float32),
+                           np.zeros(1, dtype=np.bool_), 1)
+
+# Compiled projections kept, keyed by (screen width, screen height, fov)
+PROJECTOR_CACHE_SIZE = 8
+# Minimum seconds between compiling two projection kernels; while the screen
+# size or FOV keeps changing faster than this, the NumPy projection is used
+PROJECTOR_COMPILE_INTERVAL = 1.0
+
+# Compiled projections in least recently used order, and when the last one was built
+_projectors: Dict[Tuple[int, int, float], Callable] = OrderedDict()
+_last_projector_compile = -math.inf
+
+
+def _make_projector(screen_width: int, screen_height: int, tan_half: float, tan_half_aspect: float) -> Callable:
+    """Compile a batched projection with the screen size and FOV baked in as constants
+    
+    Numba freezes the closure variables into the compiled kernel, so a new
+    kernel is built only when the screen size or FOV changes.
+    """
+    width = float(screen_width)
+    height = float(screen_height)
+    x_limit = 1 + 2 / screen_width
+    y_limit = 1 + 2 / screen_height
+    
+    @njit
+    def project(rel, basis, screen):
+        for i in range(rel.shape[0]):
+            screen[i, 0] = -1
+            screen[i, 1] = -1
+            x, y, z = rel[i, 0], rel[i, 1], rel[i, 2]
+            
+            # Cull behind the camera and outside the side planes, as in world_to_screen_batch
+            z_dot = x * basis[2, 0] + y * basis[2, 1] + z * basis[2, 2]
+            if z_dot <= 0:
+                continue
+            x_dot = x * basis[0, 0] + y * basis[0, 1] + z * basis[0, 2]
+            y_dot = x * basis[1, 0] + y * basis[1, 1] + z * basis[1, 2]
+            x_scale = z_dot * tan_half_aspect
+            y_scale = z_dot * tan_half
+            if abs(x_dot) >= x_scale * x_limit or abs(y_dot) >= y_scale * y_limit:
+                continue
+            
+            screen[i, 0] = int((x_dot / x_scale + 1) * 0.5 * width)
+            screen[i, 1] = int((1 - (y_dot / y_scale + 1) * 0.5) * height)
+    
+    return project
+
+
+def _get_projector(screen_width: int, screen_height: int, fov: float,
+                   tan_half: float, tan_half_aspect: float) -> Optional[Callable]:
+    """Get the compiled projection for a screen size and FOV, or None to use NumPy"""
+    global _last_projector_compile
+    key = (screen_width, screen_height, fov)
+    project = _projectors.get(key)
+    if project is not None:
+        _projectors.move_to_end(key)
+        return project
+    
+    # An animated FOV or resize would otherwise compile a kernel every frame
+    now = time.perf_counter()
+    if now - _last_projector_compile < PROJECTOR_COMPILE_INTERVAL:
+        return None
+    _last_projector_compile = now
+    
+    project = _make_projector(screen_width, screen_height, tan_half, tan_half_aspect)
+    _projectors[key] = project
+    if len(_projectors) > PROJECTOR_CACHE_SIZE:
+        _projectors.popitem(last=False)
+    return project
+
 
 class Camera:
     """Camera for 3D to 2D projection"""
@@ -22,6 +199,9 @@ class Camera:
         self.near = 0.1
         self.far = 1000.0
         
+        # View parameters the cached basis was built from
+        self._frame_key = None
+        
     def look_at(self, target: Vector3):
         """Point camera at target"""
         self.target = target
@@ -29,11 +209,16 @@ class Camera:
     def move(self, position: Vector3):
         """Move camera to position"""
         self.position = position
-        
-    def world_to_screen(self, position: Vector3, screen_width: int, screen_height: int) -> Tuple[int, int]:
-        """Convert 3D world position to 2D screen position"""
-        # Simple perspective projection
-        direction = (position - self.position)
+    
+    def prepare_frame(self, screen_width: int, screen_height: int):
+        """Cache the camera basis and projection constants for this frame"""
+        # Compared by value, so in-place edits such as camera.position.x += 1
+        # are picked up as well as reassignment
+        position, target, up = self.position, self.target, self.up
+        frame_key = (position.x, position.y, position.z, target.x, target.y, target.z,
+                     up.x, up.y, up.z, self.fov, screen_width, screen_height)
+        if frame_key == self._frame_key:
+            return
         
         # Calculate forward vector (normalized direction from camera to target)
         forward = (self.target - self.position).normalize()
@@ -44,44 +229,164 @@ class Camera:
         # Recalculate up vector to ensure orthogonality
         true_up = right.cross(forward).normalize()
         
+        self._eye = self.position.to_tuple()
+        self._forward = forward.to_tuple()
+        self._right = right.to_tuple()
+        self._true_up = true_up.to_tuple()
+        self._basis = np.array([self._right, self._true_up, self._forward])
+        
+        # Perspective scale factors
+        self._tan_half = math.tan(math.radians(self.fov) / 2)
+        self._tan_half_aspect = self._tan_half * (screen_width / screen_height)
+        
+        # Projection kernel specialized for this screen size and FOV
+        self._project = None
+        if njit is not None:
+            self._project = _get_projector(screen_width, screen_height, self.fov,
+                                           self._tan_half, self._tan_half_aspect)
+            if self._project is None:
+                # Compiling was deferred; prepare again next frame to pick up
+                # a kernel once the FOV or screen size settles
+                frame_key = None
+        
+        self._frame_key = frame_key
+        
+    def world_to_screen(self, position: Vector3, screen_width: int, screen_height: int) -> Tuple[int, int]:
+        """Convert 3D world position to 2D screen position"""
+        self.prepare_frame(screen_width, screen_height)
+        
+        # Simple perspective projection
+        ex, ey, ez = self._eye
+        dx, dy, dz = position.x - ex, position.y - ey, position.z - ez
+        
         # Calculate dot products for projection
-        x_dot = direction.dot(right)
-        y_dot = direction.dot(true_up)
-        z_dot = direction.dot(forward)
+        rx, ry, rz = self._right
+        ux, uy, uz = self._true_up
+        fx, fy, fz = self._forward
+        x_dot = dx * rx + dy * ry + dz * rz
+        y_dot = dx * ux + dy * uy + dz * uz
+        z_dot = dx * fx + dy * fy + dz * fz
         
         # Skip if behind camera
         if z_dot <= 0:
             return (-1, -1)  # Off-screen
         
-        # Calculate perspective projection
-        aspect_ratio = screen_width / screen_height
-        fov_rad = math.radians(self.fov)
-        
         # Project to normalized device coordinates
-        x_ndc = x_dot / (z_dot * math.tan(fov_rad / 2) * aspect_ratio)
-        y_ndc = y_dot / (z_dot * math.tan(fov_rad / 2))
+        x_ndc = x_dot / (z_dot * self._tan_half_aspect)
+        y_ndc = y_dot / (z_dot * self._tan_half)
         
         # Convert to screen coordinates
         x_screen = int((x_ndc + 1) * 0.5 * screen_width)
         y_screen = int((1 - (y_ndc + 1) * 0.5) * screen_height)
         
         return (x_screen, y_screen)
+    
+    def world_to_screen_batch(self, positions: np.ndarray, screen_width: int, screen_height: int) -> np.ndarray:
+        """Convert (N, 3) world positions to (N, 2) int32 screen positions
+        
+        Same projection as world_to_screen; points outside the view frustum
+        are culled before projection and map to (-1, -1).
+        """
+        self.prepare_frame(screen_width, screen_height)
+        rel = np.asarray(positions, dtype=np.float64).reshape(-1, 3) - self._eye
+        
+        if self._project is not None:
+            screen = np.empty((len(rel), 2), dtype=np.int32)
+            self._project(rel, self._basis, screen)
+            return screen
+        
+        screen = np.full((len(rel), 2), -1, dtype=np.int32)
+        
+        # Cull points behind the camera with a single dot product
+        z_dot = rel @ self._basis[2]
+        visible = np.flatnonzero(z_dot > 0)
+        z_dot = z_dot[visible]
+        
+        # Cull against the side planes of the view frustum before projecting;
+        # the planes are widened by the sub-pixel band that still truncates
+        # onto the screen edge
+        x_dot, y_dot = (rel[visible] @ self._basis[:2].T).T
+        x_scale = z_dot * self._tan_half_aspect
+        y_scale = z_dot * self._tan_half
+        inside = ((np.abs(x_dot) < x_scale * (1 + 2 / screen_width)) &
+                  (np.abs(y_dot) < y_scale * (1 + 2 / screen_height)))
+        visible = visible[inside]
+        
+        # Project the survivors to normalized device coordinates
+        x_ndc = x_dot[inside] / x_scale[inside]
+        y_ndc = y_dot[inside] / y_scale[inside]
+        
+        # Convert to screen coordinates
+        screen[visible, 0] = ((x_ndc + 1) * 0.5 * screen_width).astype(np.int32)
+        screen[visible, 1] = ((1 - (y_ndc + 1) * 0.5) * screen_height).astype(np.int32)
+        return screen
+
+
+def _load_image(image_path: str) -> pygame.Surface:
+    """Load an image file once and share the surface between sprites"""
+    image = _image_cache.get(image_path)
+    if image is not None:
+        _image_cache.move_to_end(image_path)
+        return image
+    
+    image = pygame.image.load(image_path)
+    if pygame.display.get_surface() is not None:
+        image = image.convert_alpha()
+    else:
+        _unconverted_paths.add(image_path)
+    _image_cache[image_path] = image
+    if len(_image_cache) > IMAGE_CACHE_SIZE:
+        evicted_path, _ = _image_cache.popitem(last=False)
+        _unconverted_paths.discard(evicted_path)
+    return image
+
+
+def _convert_pending_images():
+    """Convert images loaded before the display existed and update their sprites"""
+    if not _unconverted_paths or pygame.display.get_surface() is None:
+        return
+    for image_path in _unconverted_paths:
+        _image_cache[image_path] = _image_cache[image_path].convert_alpha()
+    _unconverted_paths.clear()
+    for sprite in list(_unconverted_sprites):
+        sprite.load_image(sprite.image_path)
+    _unconverted_sprites.clear()
+
+
+@lru_cache(maxsize=SPRITE_CACHE_SIZE)
+def _scaled_image(original: pygame.Surface, size: Tuple[int, int]) -> pygame.Surface:
+    """Scale an image once per (image, size) and share the result between sprites"""
+    return pygame.transform.scale(original, size)
+
+
+@lru_cache(maxsize=CIRCLE_CACHE_SIZE)
+def _circle_surface(radius: int, color: Tuple[int, int, int, int]) -> pygame.Surface:
+    """Get a cached surface with a filled circle of the given radius and color"""
+    surface = pygame.Surface((radius * 2, radius * 2), pygame.SRCALPHA)
+    pygame.draw.circle(surface, color, (radius, radius), radius)
+    return surface
 
 
 class Sprite:
     """2D sprite for rendering"""
     
     def __init__(self, image_path: str, scale: float = 1.0):
+        self.image_path = image_path
         self.original_image = None
         self.image = None
+        self.half_size = (0, 0)  # Offset from the sprite's center to its top-left corner
         self.scale = scale
         self.load_image(image_path)
         
     def load_image(self, image_path: str):
         """Load image from file"""
+        self.image_path = image_path
+        self.image = None  # Rescaled from the new image below
         try:
             if os.path.exists(image_path):
-                self.original_image = pygame.image.load(image_path).convert_alpha()
+                self.original_image = _load_image(image_path)
+                if image_path in _unconverted_paths:
+                    _unconverted_sprites.add(self)
                 self.resize(self.scale)
             else:
                 # Create a default colored rectangle if image not found
@@ -99,9 +404,13 @@ class Sprite:
     def resize(self, scale: float):
         """Resize the sprite"""
         if self.original_image:
+            if self.image is not None and scale == self.scale:
+                return
             width = int(self.original_image.get_width() * scale)
             height = int(self.original_image.get_height() * scale)
-            self.image = pygame.transform.scale(self.original_image, (width, height))
+            self.image = _scaled_image(self.original_image, (width, height))
+            self.half_size = (width // 2, height // 2)
+            self.scale = scale
 
 
 class RenderComponent:
@@ -134,78 +443,142 @@ class RenderComponent:
 
 
 class ParticleSystem:
-    """Simple particle system for visual effects"""
-    
-    class Particle:
-        """Individual particle"""
-        def __init__(self, position: Vector3, velocity: Vector3, color: Tuple[int, int, int], 
-                     size: float, lifetime: float):
-            self.position = position
-            self.velocity = velocity
-            self.color = color
-            self.size = size
-            self.lifetime = lifetime
-            self.age = 0
-            self.alive = True
-        
-        def update(self, delta_time: float):
-            """Update particle state"""
-            self.position = self.position + (self.velocity * delta_time)
-            self.age += delta_time
-            
-            # Fade out based on lifetime
-            if self.age >= self.lifetime:
-                self.alive = False
+    """Simple particle system for visual effects
+    
+    Particles are stored as a structure of arrays in the first `count` slots;
+    `_alive` marks which of them are live. Dead slots are reclaimed in bulk
+    by `compact`.
+    """
     
     def __init__(self, position: Vector3 = Vector3()):
         self.position = position
-        self.particles: List[ParticleSystem.Particle] = []
-        self.max_particles = 100
+        self.count = 0
         self.emission_rate = 10  # Particles per second
         self.emission_timer = 0
         self.active = False
+        self._rng = np.random.default_rng()
+        self.palette = DEFAULT_PARTICLE_PALETTE  # (P, 3) uint8 RGB, at most 256 entries
+        self.max_particles = 100
+    
+    @property
+    def palette(self) -> np.ndarray:
+        """(P, 3) uint8 RGB colors that particle color indices refer to"""
+        return self._palette
+    
+    @palette.setter
+    def palette(self, palette: np.ndarray):
+        palette = np.asarray(palette, dtype=np.uint8).reshape(-1, 3)
+        if not 1 <= len(palette) <= 256:
+            raise ValueError("Particle palette must have between 1 and 256 colors")
+        self._palette = palette
+        # Remap live particles onto the new palette so none indexes past its end
+        if self.count:
+            self.color_indices[:self.count] %= len(palette)
+    
+    @property
+    def max_particles(self) -> int:
+        """Capacity of the particle arrays"""
+        return len(self.ages)
+    
+    @max_particles.setter
+    def max_particles(self, max_particles: int):
+        # Reallocate the arrays, keeping as many live particles as still fit
+        if self.count:
+            self.compact()
+        keep = min(self.count, max_particles)
+        arrays = {
+            "positions": ((max_particles, 3), np.float32),
+            "velocities": ((max_particles, 3), np.int16),  # Scaled by PARTICLE_VELOCITY_SCALE
+            "color_indices": ((max_particles,), np.uint8),
+            "sizes": ((max_particles,), np.uint8),  # Radius in pixels
+            "ages": ((max_particles,), np.float32),
+            "lifetimes": ((max_particles,), np.float32),
+            "_alive": ((max_particles,), np.bool_)
+        }
+        for name, (shape, dtype) in arrays.items():
+            array = np.zeros(shape, dtype=dtype)
+            if keep:
+                array[:keep] = getattr(self, name)[:keep]
+            setattr(self, name, array)
+        self.count = keep
+    
+    @property
+    def live_count(self) -> int:
+        """Number of live particles"""
+        return int(np.count_nonzero(self._alive[:self.count]))
+    
+    def compact(self):
+        """Move the live particles into the front slots and drop the dead ones"""
+        n = self.count
+        if _compact_particles_jit is not None:
+            self.count = _compact_particles_jit(self.positions, self.velocities, self.color_indices,
+                                                self.sizes, self.ages, self.lifetimes, self._alive, n)
+        else:
+            alive = self._alive[:n]
+            live = int(np.count_nonzero(alive))
+            if live < n:
+                for array in (self.positions, self.velocities, self.color_indices,
+                              self.sizes, self.ages, self.lifetimes):
+                    array[:live] = array[:n][alive]
+                self._alive[:live] = True
+                self.count = live
     
     def emit(self, count: int = 1):
         """Emit particles"""
-        import random
-        
-        for _ in range(count):
-            if len(self.particles) >= self.max_particles:
-                break
-                
-            # Random velocity in a sphere
-            angle1 = random.uniform(0, math.pi * 2)
-            angle2 = random.uniform(0, math.pi)
-            speed = random.uniform(1, 3)
-            
-            vx = math.sin(angle2) * math.cos(angle1) * speed
-            vy = math.sin(angle2) * math.sin(angle1) * speed
-            vz = math.cos(angle2) * speed
-            
-            # Random color variations
-            r = min(255, max(0, random.randint(200, 255)))
-            g = min(255, max(0, random.randint(100, 200)))
-            b = min(255, max(0, random.randint(0, 100)))
-            
-            # Create particle
-            particle = self.Particle(
-                position=Vector3(self.position.x, self.position.y, self.position.z),
-                velocity=Vector3(vx, vy, vz),
-                color=(r, g, b),
-                size=random.uniform(2, 5),
-                lifetime=random.uniform(0.5, 2.0)
-            )
-            
-            self.particles.append(particle)
+        if count > self.max_particles - self.count:
+            self.compact()  # Reuse dead slots before giving up on capacity
+        start = self.count
+        count = min(count, self.max_particles - start)
+        if count <= 0:
+            return
+        end = start + count
+        rng = self._rng
+        
+        # Draw every uniform attribute in one float32 block and scale the rows
+        # in place: angle1, angle2, speed, size, lifetime
+        draws = rng.random((5, count), dtype=np.float32)
+        draws *= np.array([[math.pi * 2], [math.pi], [2], [3], [1.5]], dtype=np.float32)
+        draws += np.array([[0], [0], [1], [2], [0.5]], dtype=np.float32)
+        angle1, angle2, speed, sizes, lifetimes = draws
+        
+        # Random velocity in a sphere
+        speed *= PARTICLE_VELOCITY_SCALE
+        sin2 = np.sin(angle2) * speed
+        velocities = self.velocities[start:end]
+        velocities[:, 0] = sin2 * np.cos(angle1)
+        velocities[:, 1] = sin2 * np.sin(angle1)
+        velocities[:, 2] = np.cos(angle2) * speed
+        
+        self.positions[start:end] = (self.position.x, self.position.y, self.position.z)
+        
+        # Random color variations
+        self.color_indices[start:end] = rng.integers(0, len(self.palette), count)
+        
+        self.sizes[start:end] = np.rint(sizes)
+        self.lifetimes[start:end] = lifetimes
+        self.ages[start:end] = 0
+        self._alive[start:end] = True
+        self.count = end
     
     def update(self, delta_time: float):
         """Update all particles"""
-        # Remove dead particles
-        self.particles = [p for p in self.particles if p.alive]
-        
-        # Update remaining particles
-        for particle in self.particles:
-            particle.update(delta_time)
+        n = self.count
+        if n:
+            # Integrate and age the live particles
+            alive = self._alive[:n]
+            if _step_particles_jit is not None:
+                _step_particles_jit(self.positions[:n], self.velocities[:n], self.ages[:n],
+                                    self.lifetimes[:n], alive, np.float32(delta_time),
+                                    np.float32(delta_time / PARTICLE_VELOCITY_SCALE))
+            else:
+                self.positions[:n] += self.velocities[:n] * np.float32(delta_time / PARTICLE_VELOCITY_SCALE)
+                self.ages[:n] += delta_time
+                np.less(self.ages[:n], self.lifetimes[:n], out=alive)
+            
+            # Dead particles stay in their slots until enough pile up to be
+            # worth a compaction pass
+            if n - np.count_nonzero(alive) > PARTICLE_COMPACT_FRACTION * n:
+                self.compact()
         
         # Emit new particles if active
         if self.active:
@@ -227,32 +600,68 @@ class ParticleSystem:
 class RenderSystem:
     """Rendering system for game objects"""
     
-    def __init__(self, screen_width: int = 800, screen_height: int = 600, title: str = "MCP Game"):
+    def __init__(self, screen_width: int = 800, screen_height: int = 600, title: str = "MCP Game",
+                 headless: bool = False):
         self.screen_width = screen_width
         self.screen_height = screen_height
         self.title = title
+        
+        # Only start the pygame subsystems rendering uses; headless mode renders
+        # to SDL's dummy video driver unless another driver was chosen
+        if headless:
+            os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+        if not pygame.display.get_init():
+            pygame.display.init()
+        if not pygame.font.get_init():
+            pygame.font.init()
         self.screen = pygame.display.set_mode((screen_width, screen_height))
         pygame.display.set_caption(title)
+        _convert_pending_images()
         
         self.camera = Camera()
         self.render_components: List[RenderComponent] = []
+        self._components_dirty = False
         self.particle_systems: List[ParticleSystem] = []
         self.background_color = (0, 0, 0)  # Black background
         self.debug_mode = False
         
         # Font for debug text
         self.font = pygame.font.SysFont(None, 24)
+        
+        # Clock the debug HUD reads FPS from; the game loop should share the clock
+        # it ticks, otherwise render ticks a private one once per frame
+        self.fps_clock: Optional[pygame.time.Clock] = None
+        self._hud_clock = pygame.time.Clock()
+        
+        # Rendered debug text surfaces keyed by their text
+        self._hud_cache: Dict[str, pygame.Surface] = {}
+        
+        # Flattened particle sprite tables per palette, indexed by
+        # (color index * alpha levels + alpha level - 1) * max radius + radius - 1
+        self._particle_sprite_tables: Dict[bytes, List[pygame.Surface]] = {}
+    
+    def preload_atlas(self, paths: List[str]) -> Dict[str, pygame.Surface]:
+        """Load and convert a set of sprite images up front into the shared cache"""
+        atlas = {}
+        for image_path in paths:
+            try:
+                atlas[image_path] = _load_image(image_path)
+            except (pygame.error, FileNotFoundError):
+                continue  # Sprites fall back to the missing texture for this path
+        return atlas
     
     def add_render_component(self, component: RenderComponent):
         """Add a render component to the system"""
         self.render_components.append(component)
-        # Sort by layer
-        self.render_components.sort(key=lambda c: c.layer)
+        # Sorted by layer lazily, before the next render
+        self._components_dirty = True
     
     def remove_render_component(self, component: RenderComponent):
         """Remove a render component from the system"""
-        if component in self.render_components:
+        try:
             self.render_components.remove(component)
+        except ValueError:
+            pass
     
     def add_particle_system(self, particle_system: ParticleSystem):
         """Add a particle system to the renderer"""
@@ -275,78 +684,125 @@ class RenderSystem:
         """Toggle debug rendering"""
         self.debug_mode = not self.debug_mode
     
+    def _particle_sprites(self, palette: np.ndarray) -> List[pygame.Surface]:
+        """Get the flattened pre-rendered particle sprite table for a palette"""
+        key = palette.tobytes()
+        table = self._particle_sprite_tables.get(key)
+        if table is None:
+            # Palettes can be set freely, so keep the cache bounded
+            if len(self._particle_sprite_tables) >= PARTICLE_TABLE_CACHE_SIZE:
+                self._particle_sprite_tables.clear()
+            table = [
+                _circle_surface(radius, (r, g, b, level * 255 // PARTICLE_ALPHA_LEVELS))
+                for r, g, b in palette.tolist()
+                for level in range(1, PARTICLE_ALPHA_LEVELS + 1)
+                for radius in range(1, PARTICLE_MAX_RADIUS + 1)
+            ]
+            self._particle_sprite_tables[key] = table
+        return table
+    
+    def _hud_text(self, text: str) -> pygame.Surface:
+        """Get a rendered debug text surface, re-rasterizing only new strings"""
+        surface = self._hud_cache.get(text)
+        if surface is None:
+            # Counters keep changing, so keep the cache bounded
+            if len(self._hud_cache) >= HUD_CACHE_SIZE:
+                self._hud_cache.clear()
+            surface = self.font.render(text, True, (255, 255, 255))
+            self._hud_cache[text] = surface
+        return surface
+    
     def render(self):
         """Render all visible components"""
         # Clear screen
         self.screen.fill(self.background_color)
         
+        # Camera basis and projection constants are fixed for the frame
+        self.camera.prepare_frame(self.screen_width, self.screen_height)
+        
+        # Sort by layer if components were added since the last frame
+        if self._components_dirty:
+            self.render_components.sort(key=attrgetter('layer'))
+            self._components_dirty = False
+        
         # Render game objects
-        for component in self.render_components:
-            if not component.visible:
-                continue
-                
-            # Get world position
-            world_pos = Vector3.from_tuple(component.game_object.position)
-            
-            # Convert to screen position
-            screen_pos = self.camera.world_to_screen(world_pos, self.screen_width, self.screen_height)
+        visible = [component for component in self.render_components if component.visible]
+        if visible:
+            # Convert all world positions to screen positions in one batch and
+            # drop the off-screen components with an array mask
+            positions = [component.game_object.position for component in visible]
+            screen_positions = self.camera.world_to_screen_batch(
+                [(p.x, p.y, p.z) if isinstance(p, Vector3) else p for p in positions],
+                self.screen_width, self.screen_height
+            )
+            on_screen = ((screen_positions >= 0).all(axis=1) &
+                         (screen_positions[:, 0] <= self.screen_width) &
+                         (screen_positions[:, 1] <= self.screen_height))
             
-            # Skip if off-screen
-            if screen_pos[0] < 0 or screen_pos[1] < 0 or \
-               screen_pos[0] > self.screen_width or screen_pos[1] > self.screen_height:
-                continue
+            # Collect sprites and circles in layer order and draw them in one blits call
+            blits = []
+            for component, (x, y) in zip(compress(visible, on_screen.tolist()),
+                                         screen_positions[on_screen].tolist()):
+                sprite = component.sprite
+                if sprite and sprite.image:
+                    # Center the sprite on its screen position
+                    half_width, half_height = sprite.half_size
+                    blits.append((sprite.image, (x - half_width, y - half_height)))
+                else:
+                    # Draw a simple circle if no sprite
+                    radius = max(1, round(10 * component.scale))
+                    # Any pygame color value is accepted, as when drawing straight onto
+                    # the screen; that surface has no alpha, so circles stay opaque
+                    r, g, b, _ = pygame.Color(component.color)
+                    surface = _circle_surface(radius, (r, g, b, 255))
+                    blits.append((surface, (x - radius, y - radius)))
             
-            # Render sprite if available
-            if component.sprite and component.sprite.image:
-                # Calculate sprite position (centered)
-                sprite_rect = component.sprite.image.get_rect()
-                sprite_rect.center = screen_pos
-                
-                # Draw sprite
-                self.screen.blit(component.sprite.image, sprite_rect)
-            else:
-                # Draw a simple circle if no sprite
-                pygame.draw.circle(self.screen, component.color, screen_pos, 10 * component.scale)
+            self.screen.blits(blits, doreturn=False)
         
         # Render particles
         for particle_system in self.particle_systems:
-            for particle in particle_system.particles:
-                # Convert to screen position
-                screen_pos = self.camera.world_to_screen(
-                    particle.position, self.screen_width, self.screen_height
-                )
-                
-                # Skip if off-screen
-                if screen_pos[0] < 0 or screen_pos[1] < 0 or \
-                   screen_pos[0] > self.screen_width or screen_pos[1] > self.screen_height:
-                    continue
-                
-                # Calculate alpha based on lifetime
-                alpha = 255 * (1 - (particle.age / particle.lifetime))
-                color = (*particle.color, int(alpha))
-                
-                # Draw particle
-                pygame.draw.circle(
-                    self.screen, 
-                    color, 
-                    screen_pos, 
-                    particle.size
-                )
+            n = particle_system.count
+            if not n:
+                continue
+            
+            # Convert to screen positions and keep the on-screen particles
+            screen_pos = self.camera.world_to_screen_batch(
+                particle_system.positions[:n], self.screen_width, self.screen_height
+            )
+            on_screen = ((screen_pos >= 0).all(axis=1) &
+                         (screen_pos[:, 0] <= self.screen_width) & (screen_pos[:, 1] <= self.screen_height))
+            on_screen &= particle_system._alive[:n]
+            
+            # Gather the on-screen particles and quantize them to sprite table
+            # entries entirely in array ops
+            sizes = particle_system.sizes[:n][on_screen]
+            fade = 1 - particle_system.ages[:n][on_screen] / particle_system.lifetimes[:n][on_screen]
+            radii = np.clip(sizes, 1, PARTICLE_MAX_RADIUS).astype(np.int32)
+            alpha_levels = np.clip(np.ceil(fade * PARTICLE_ALPHA_LEVELS), 1, PARTICLE_ALPHA_LEVELS).astype(np.int32)
+            sprite_idx = ((particle_system.color_indices[:n][on_screen].astype(np.int32) * PARTICLE_ALPHA_LEVELS
+                           + alpha_levels - 1) * PARTICLE_MAX_RADIUS + radii - 1)
+            corners = screen_pos[on_screen] - radii[:, None]
+            
+            # Only the final pairing with surfaces is left to Python, done with map/zip
+            table = self._particle_sprites(particle_system.palette)
+            self.screen.blits(zip(map(table.__getitem__, sprite_idx.tolist()), corners.tolist()), doreturn=False)
         
         # Debug rendering
+        clock = self.fps_clock
+        if clock is None:
+            clock = self._hud_clock
+            clock.tick()
+        
         if self.debug_mode:
-            fps = int(pygame.time.Clock().get_fps())
-            fps_text = self.font.render(f"FPS: {fps}", True, (255, 255, 255))
-            self.screen.blit(fps_text, (10, 10))
+            fps = int(clock.get_fps())
+            self.screen.blit(self._hud_text(f"FPS: {fps}"), (10, 10))
             
             # Object count
-            obj_text = self.font.render(f"Objects: {len(self.render_components)}", True, (255, 255, 255))
-            self.screen.blit(obj_text, (10, 40))
+            self.screen.blit(self._hud_text(f"Objects: {len(self.render_components)}"), (10, 40))
             
             # Particle count
-            total_particles = sum(len(ps.particles) for ps in self.particle_systems)
-            particle_text = self.font.render(f"Particles: {total_particles}", True, (255, 255, 255))
-            self.screen.blit(particle_text, (10, 70))
+            total_particles = sum(ps.live_count for ps in self.particle_systems)
+            self.screen.blit(self._hud_text(f"Particles: {total_particles}"), (10, 70))
         
         # Update display
         pygame.display.flip()
\ No newline at end of file
@@ -4,14 +4,30 @@ Weather System for MCP Games
 
 import random
 import math
+import heapq
+import itertools
 import logging
 from typing import Dict, List, Any, Optional, Tuple, Callable
 from enum import Enum, auto
-from dataclasses import dataclass
+from dataclasses import dataclass, field, replace
+
+import numpy as np
 
 from .physics import Vector3
 from .renderer import ParticleSystem
 
+try:
+    from numba import njit
+except ImportError:  # Numba is optional; transitions are interpolated with NumPy ops without it
+    njit = None
+
+# Random draws generated per NumPy call by the weather's uniform streams
+RANDOM_BUFFER_SIZE = 64
+
+# Smallest changes in ambient light and visibility range worth applying
+AMBIENT_LIGHT_EPSILON = 1e-3
+VISIBILITY_RANGE_EPSILON = 1e-2
+
 class WeatherType(Enum):
     """Types of weather conditions"""
     CLEAR = auto()
@@ -25,15 +41,26 @@ class WeatherType(Enum):
     WINDY = auto()
 
 
+# Candidates for automatic weather changes, excluding the current weather
+_ALL_WEATHER = tuple(WeatherType)
+_OTHER_WEATHER: Dict[WeatherType, Tuple[WeatherType, ...]] = {
+    weather: tuple(other for other in _ALL_WEATHER if other != weather) for weather in _ALL_WEATHER
+}
+
+
 @dataclass
 class WeatherParameters:
-    """Parameters for weather conditions"""
+    """Parameters for weather conditions
+    
+    Colors are tuples and wind_direction is shared with copies made by
+    dataclasses.replace, so it is replaced rather than mutated in place.
+    """
     particle_count: int = 0
     particle_size: float = 1.0
     particle_speed: float = 1.0
     particle_color: Tuple[int, int, int] = (255, 255, 255)
     particle_alpha: int = 255
-    wind_direction: Vector3 = Vector3(0, 0, 0)
+    wind_direction: Vector3 = field(default_factory=Vector3)
     wind_strength: float = 0.0
     fog_density: float = 0.0
     fog_color: Tuple[int, int, int] = (200, 200, 200)
@@ -42,124 +69,193 @@ class WeatherParameters:
     ambient_light: float = 1.0  # 0.0 to 1.0, affects brightness
     visibility_range: float = 100.0  # How far can be seen
     
+    def as_vector(self) -> np.ndarray:
+        """Pack the fields interpolated during transitions into an array"""
+        return np.array([self.particle_count, self.particle_size, self.particle_speed,
+                         self.wind_strength, self.fog_density, self.ambient_light,
+                         self.visibility_range], dtype=np.float64)
+    
     @classmethod
     def create_for_weather(cls, weather_type: WeatherType) -> 'WeatherParameters':
-        """Create parameters for a specific weather type"""
-        if weather_type == WeatherType.CLEAR:
-            return cls(
-                particle_count=0,
-                wind_strength=0.1,
-                ambient_light=1.0,
-                visibility_range=100.0
-            )
-        elif weather_type == WeatherType.CLOUDY:
-            return cls(
-                particle_count=0,
-                wind_strength=0.3,
-                fog_density=0.1,
-                ambient_light=0.8,
-                visibility_range=80.0
-            )
-        elif weather_type == WeatherType.RAIN:
-            return cls(
-                particle_count=100,
-                particle_size=0.8,
-                particle_speed=8.0,
-                particle_color=(100, 150, 255),
-                particle_alpha=180,
-                wind_direction=Vector3(0.2, -1.0, 0),
-                wind_strength=0.5,
-                fog_density=0.2,
-                sound_effect="rain",
-                ambient_light=0.7,
-                visibility_range=60.0
-            )
-        elif weather_type == WeatherType.HEAVY_RAIN:
-            return cls(
-                particle_count=300,
-                particle_size=1.0,
-                particle_speed=12.0,
-                particle_color=(80, 120, 255),
-                particle_alpha=200,
-                wind_direction=Vector3(0.4, -1.0, 0),
-                wind_strength=0.8,
-                fog_density=0.4,
-                sound_effect="heavy_rain",
-                ambient_light=0.5,
-                visibility_range=40.0
-            )
-        elif weather_type == WeatherType.STORM:
-            return cls(
-                particle_count=250,
-                particle_size=1.2,
-                particle_speed=15.0,
-                particle_color=(70, 100, 200),
-                particle_alpha=220,
-                wind_direction=Vector3(0.8, -1.0, 0.2),
-                wind_strength=1.2,
-                fog_density=0.5,
-                lightning_chance=0.02,
-                sound_effect="storm",
-                ambient_light=0.4,
-                visibility_range=30.0
-            )
-        elif weather_type == WeatherType.SNOW:
-            return cls(
-                particle_count=80,
-                particle_size=0.6,
-                particle_speed=2.0,
-                particle_color=(240, 240, 255),
-                particle_alpha=200,
-                wind_direction=Vector3(0.1, -0.5, 0),
-                wind_strength=0.3,
-                fog_density=0.3,
-                sound_effect="snow",
-                ambient_light=0.8,
-                visibility_range=50.0
-            )
-        elif weather_type == WeatherType.BLIZZARD:
-            return cls(
-                particle_count=250,
-                particle_size=0.7,
-                particle_speed=6.0,
-                particle_color=(230, 230, 255),
-                particle_alpha=220,
-                wind_direction=Vector3(0.7, -0.7, 0.2),
-                wind_strength=1.5,
-                fog_density=0.7,
-                sound_effect="blizzard",
-                ambient_light=0.6,
-                visibility_range=20.0
-            )
-        elif weather_type == WeatherType.FOG:
-            return cls(
-                particle_count=0,
-                fog_density=0.8,
-                fog_color=(180, 180, 180),
-                wind_strength=0.1,
-                ambient_light=0.7,
-                visibility_range=15.0
-            )
-        elif weather_type == WeatherType.WINDY:
-            return cls(
-                particle_count=20,
-                particle_size=0.5,
-                particle_speed=3.0,
-                particle_color=(200, 200, 150),
-                particle_alpha=150,
-                wind_direction=Vector3(1.0, -0.1, 0.2),
-                wind_strength=1.8,
-                sound_effect="wind",
-                ambient_light=0.9,
-                visibility_range=70.0
-            )
-        else:
-            return cls()
+        """Get the parameters for a specific weather type
+        
+        The instance is shared between callers; copy it with dataclasses.replace
+        before mutating it.
+        """
+        return _PARAMS_BY_TYPE.get(weather_type, _DEFAULT_PARAMS)
+
+
+# Parameters per weather type; weather types are a fixed set, so these are
+# built once and shared
+_PARAMS_BY_TYPE: Dict[WeatherType, WeatherParameters] = {
+    WeatherType.CLEAR: WeatherParameters(
+        particle_count=0,
+        wind_strength=0.1,
+        ambient_light=1.0,
+        visibility_range=100.0
+    ),
+    WeatherType.CLOUDY: WeatherParameters(
+        particle_count=0,
+        wind_strength=0.3,
+        fog_density=0.1,
+        ambient_light=0.8,
+        visibility_range=80.0
+    ),
+    WeatherType.RAIN: WeatherParameters(
+        particle_count=100,
+        particle_size=0.8,
+        particle_speed=8.0,
+        particle_color=(100, 150, 255),
+        particle_alpha=180,
+        wind_direction=Vector3(0.2, -1.0, 0),
+        wind_strength=0.5,
+        fog_density=0.2,
+        sound_effect="rain",
+        ambient_light=0.7,
+        visibility_range=60.0
+    ),
+    WeatherType.HEAVY_RAIN: WeatherParameters(
+        particle_count=300,
+        particle_size=1.0,
+        particle_speed=12.0,
+        particle_color=(80, 120, 255),
+        particle_alpha=200,
+        wind_direction=Vector3(0.4, -1.0, 0),
+        wind_strength=0.8,
+        fog_density=0.4,
+        sound_effect="heavy_rain",
+        ambient_light=0.5,
+        visibility_range=40.0
+    ),
+    WeatherType.STORM: WeatherParameters(
+        particle_count=250,
+        particle_size=1.2,
+        particle_speed=15.0,
+        particle_color=(70, 100, 200),
+        particle_alpha=220,
+        wind_direction=Vector3(0.8, -1.0, 0.2),
+        wind_strength=1.2,
+        fog_density=0.5,
+        lightning_chance=0.02,
+        sound_effect="storm",
+        ambient_light=0.4,
+        visibility_range=30.0
+    ),
+    WeatherType.SNOW: WeatherParameters(
+        particle_count=80,
+        particle_size=0.6,
+        particle_speed=2.0,
+        particle_color=(240, 240, 255),
+        particle_alpha=200,
+        wind_direction=Vector3(0.1, -0.5, 0),
+        wind_strength=0.3,
+        fog_density=0.3,
+        sound_effect="snow",
+        ambient_light=0.8,
+        visibility_range=50.0
+    ),
+    WeatherType.BLIZZARD: WeatherParameters(
+        particle_count=250,
+        particle_size=0.7,
+        particle_speed=6.0,
+        particle_color=(230, 230, 255),
+        particle_alpha=220,
+        wind_direction=Vector3(0.7, -0.7, 0.2),
+        wind_strength=1.5,
+        fog_density=0.7,
+        sound_effect="blizzard",
+        ambient_light=0.6,
+        visibility_range=20.0
+    ),
+    WeatherType.FOG: WeatherParameters(
+        particle_count=0,
+        fog_density=0.8,
+        fog_color=(180, 180, 180),
+        wind_strength=0.1,
+        ambient_light=0.7,
+        visibility_range=15.0
+    ),
+    WeatherType.WINDY: WeatherParameters(
+        particle_count=20,
+        particle_size=0.5,
+        particle_speed=3.0,
+        particle_color=(200, 200, 150),
+        particle_alpha=150,
+        wind_direction=Vector3(1.0, -0.1, 0.2),
+        wind_strength=1.8,
+        sound_effect="wind",
+        ambient_light=0.9,
+        visibility_range=70.0
+    )
+}
+
+# Parameters for weather types without an entry
+_DEFAULT_PARAMS = WeatherParameters()
+
+
+def _build_param_table() -> np.ndarray:
+    """Stack the interpolated parameters of every weather type into one table
+    
+    Row i holds the weather type with value i and row 0 the defaults. Rows
+    are padded to 8 float64s so each one fills a 64-byte line.
+    """
+    table = np.zeros((len(WeatherType) + 1, 8), dtype=np.float64)
+    table[0, :7] = _DEFAULT_PARAMS.as_vector()
+    for weather_type, params in _PARAMS_BY_TYPE.items():
+        table[weather_type.value, :7] = params.as_vector()
+    return table
+
+
+_PARAM_TABLE = _build_param_table()
+
+# Transition deltas for every ordered pair of table rows:
+# _DELTA_TABLE[a, b] = _PARAM_TABLE[b] - _PARAM_TABLE[a]
+_DELTA_TABLE = _PARAM_TABLE[np.newaxis, :, :] - _PARAM_TABLE[:, np.newaxis, :]
+
+
+def _interp_params(from_vec, delta_vec, t, out):
+    """Write the transition parameters from_vec + delta_vec * t into out
+    
+    Written in the numba subset so it can be compiled with njit.
+    """
+    for i in range(from_vec.shape[0]):
+        out[i] = from_vec[i] + delta_vec[i] * t
+
+
+_interp_params_jit = njit(fastmath=True, cache=True)(_interp_params) if njit is not None else None
+
+if _interp_params_jit is not None:
+    # Compile up front so the first transition frame does not hitch
+    _interp_params_jit(np.zeros(8), np.zeros(8), 0.0, np.zeros(8))
+
+
+class _UniformStream:
+    """Uniform random floats in [low, high) served from a refilled NumPy buffer"""
+    
+    __slots__ = ('_rng', '_low', '_high', '_values', '_index')
+    
+    def __init__(self, rng: np.random.Generator, low: float, high: float):
+        self._rng = rng
+        self._low = low
+        self._high = high
+        self._values: List[float] = []
+        self._index = 0
+    
+    def next(self) -> float:
+        """Take the next draw, refilling the buffer when it runs out"""
+        if self._index == len(self._values):
+            self._values = self._rng.uniform(self._low, self._high, RANDOM_BUFFER_SIZE).tolist()
+            self._index = 0
+        value = self._values[self._index]
+        self._index += 1
+        return value
 
 
 class WeatherEffect:
     """Base class for weather effects"""
     
+    __slots__ = ('weather_system', 'active')
+    
     def __init__(self, weather_system: 'WeatherSystem'):
         self.weather_system = weather_system
         self.active = False
@@ -180,6 +276,8 @@ class WeatherEffect:
 class ParticleWeatherEffect(WeatherEffect):
     """Weather effect using particles"""
     
+    __slots__ = ('params', 'particle_systems', 'spawn_timer', 'spawn_interval')
+    
     def __init__(self, weather_system: 'WeatherSystem', params: WeatherParameters):
         super().__init__(weather_system)
         self.params = params
@@ -188,20 +286,17 @@ class ParticleWeatherEffect(WeatherEffect):
         self.spawn_interval = 0.1  # Time between particle system spawns
         
         # Create initial particle systems
-        self._create_particle_systems()
+        self._configure_particle_systems()
     
-    def _create_particle_systems(self):
-        """Create particle systems for the effect"""
-        # Clear existing particle systems
-        for ps in self.particle_systems:
-            self.weather_system.engine.render_system.remove_particle_system(ps)
-        
-        self.particle_systems = []
+    def _configure_particle_systems(self):
+        """Create the effect's particle system on first use and retune it in place"""
+        if self.params.particle_count <= 0:
+            return
         
-        # Create new particle systems if needed
-        if self.params.particle_count > 0:
+        if not self.particle_systems:
             # Create a particle system at camera position
-            camera_pos = self.weather_system.engine.render_system.camera.position
+            render_system = self.weather_system.engine.render_system
+            camera_pos = render_system.camera.position
             
             # Adjust position to be above and around the camera
             spawn_pos = Vector3(
@@ -210,17 +305,17 @@ class ParticleWeatherEffect(WeatherEffect):
                 camera_pos.z
             )
             
-            ps = self.weather_system.engine.create_particle_system(spawn_pos)
-            ps.max_particles = self.params.particle_count
-            ps.emission_rate = self.params.particle_count / 2
-            
-            # Customize particle system based on weather parameters
-            # This would be implemented in a real particle system
-            # For this example, we'll just store the parameters
-            ps.set_property("weather_params", self.params)
-            
+            ps = ParticleSystem(spawn_pos)
+            render_system.add_particle_system(ps)
             self.particle_systems.append(ps)
-            ps.start()
+        
+        # Customize the long-lived particle systems for the weather parameters;
+        # resizing reallocates their arrays, so only do it when the size changes
+        for ps in self.particle_systems:
+            if ps.max_particles != self.params.particle_count:
+                ps.max_particles = self.params.particle_count
+            ps.emission_rate = self.params.particle_count / 2
+            ps.palette = np.array([self.params.particle_color], dtype=np.uint8)
     
     def update(self, delta_time: float):
         """Update the particle effect"""
@@ -262,6 +357,9 @@ class ParticleWeatherEffect(WeatherEffect):
 class LightningEffect(WeatherEffect):
     """Lightning effect for storms"""
     
+    __slots__ = ('chance', 'flash_active', 'flash_duration', 'flash_timer', 'flash_intensity',
+                 'time_until_next', '_flash_intervals', '_thunder_delays', '_intensities')
+    
     def __init__(self, weather_system: 'WeatherSystem', chance: float = 0.01):
         super().__init__(weather_system)
         self.chance = chance
@@ -269,7 +367,17 @@ class LightningEffect(WeatherEffect):
         self.flash_duration = 0.1
         self.flash_timer = 0
         self.flash_intensity = 0.0
-        self.time_until_next = random.uniform(5, 15)
+        
+        # Buffered random draws for flash timing, thunder delay and intensity
+        rng = weather_system._rng
+        self._flash_intervals = _UniformStream(rng, 5, 15)
+        self._thunder_delays = _UniformStream(rng, 0.5, 3.0)
+        self._intensities = _UniformStream(rng, 0.8, 1.0)
+        self.time_until_next = self._flash_intervals.next()
+    
+    def _play_thunder(self):
+        """Play the thunder that follows a flash"""
+        self.weather_system.engine.sound_system.play_sound("thunder")
     
     def update(self, delta_time: float):
         """Update the lightning effect"""
@@ -285,26 +393,21 @@ class LightningEffect(WeatherEffect):
                 self.weather_system.set_ambient_light(self.weather_system.current_params.ambient_light)
                 
                 # Play thunder sound with delay
-                thunder_delay = random.uniform(0.5, 3.0)
-                self.weather_system.engine.register_event_handler(
-                    "thunder",
-                    lambda: self.weather_system.engine.sound_system.play_sound("thunder")
-                )
-                # In a real implementation, we would schedule this event
-                # For this example, we'll just log it
+                thunder_delay = self._thunder_delays.next()
+                self.weather_system.schedule(thunder_delay, self._play_thunder)
                 self.weather_system.logger.info(f"Thunder will sound in {thunder_delay:.1f} seconds")
         else:
             # Check for new lightning
             self.time_until_next -= delta_time
             if self.time_until_next <= 0:
                 self.trigger_lightning()
-                self.time_until_next = random.uniform(5, 15)
+                self.time_until_next = self._flash_intervals.next()
     
     def trigger_lightning(self):
         """Trigger a lightning flash"""
         self.flash_active = True
         self.flash_timer = self.flash_duration
-        self.flash_intensity = random.uniform(0.8, 1.0)
+        self.flash_intensity = self._intensities.next()
         
         # Increase ambient light for flash
         self.weather_system.set_ambient_light(self.flash_intensity)
@@ -316,6 +419,8 @@ class LightningEffect(WeatherEffect):
 class FogEffect(WeatherEffect):
     """Fog effect"""
     
+    __slots__ = ('density', 'color', 'target_density', 'current_density', 'transition_speed')
+    
     def __init__(self, weather_system: 'WeatherSystem', density: float = 0.5, color: Tuple[int, int, int] = (200, 200, 200)):
         super().__init__(weather_system)
         self.density = density
@@ -330,19 +435,18 @@ class FogEffect(WeatherEffect):
             # Fade out fog
             self.target_density = 0
         
-        # Smoothly transition to target density
-        if self.current_density < self.target_density:
-            self.current_density = min(self.target_density, 
-                                      self.current_density + self.transition_speed * delta_time)
-        elif self.current_density > self.target_density:
-            self.current_density = max(self.target_density, 
-                                      self.current_density - self.transition_speed * delta_time)
+        # Smoothly transition to target density: move toward it by at most one
+        # step, landing exactly on the target once within reach
+        remaining = self.target_density - self.current_density
+        self.current_density = self.target_density - math.copysign(
+            max(abs(remaining) - self.transition_speed * delta_time, 0.0), remaining)
         
         # Apply fog to renderer
         # In a real implementation, we would set fog parameters in the renderer
         # For this example, we'll just log it
-        if self.current_density > 0.01:
-            self.weather_system.logger.debug(f"Fog density: {self.current_density:.2f}")
+        logger = self.weather_system.logger
+        if self.current_density > 0.01 and logger.isEnabledFor(logging.DEBUG):
+            logger.debug(f"Fog density: {self.current_density:.2f}")
     
     def set_density(self, density: float):
         """Set fog density"""
@@ -356,10 +460,18 @@ class FogEffect(WeatherEffect):
 class WeatherSystem:
     """Weather system for dynamic environmental effects"""
     
+    __slots__ = ('engine', 'current_weather', 'current_params', 'target_weather', 'transition_progress',
+                 'transition_duration', 'time_until_change', 'auto_change', 'logger',
+                 '_to_params', '_from_vec', '_delta_vec', '_params_vec', '_wind_offset',
+                 '_last_ambient', '_last_visibility', '_clock', '_timers', '_timer_ids',
+                 'particle_effect', 'lightning_effect', 'fog_effect', 'active_effects',
+                 '_particle_active', '_fog_active', '_rng', '_transition_durations', '_change_intervals')
+    
     def __init__(self, engine: Any):
         self.engine = engine
         self.current_weather = WeatherType.CLEAR
-        self.current_params = WeatherParameters.create_for_weather(WeatherType.CLEAR)
+        # Interpolated during transitions, so this is a private copy
+        self.current_params = replace(WeatherParameters.create_for_weather(WeatherType.CLEAR))
         self.target_weather = WeatherType.CLEAR
         self.transition_progress = 1.0  # 0.0 to 1.0
         self.transition_duration = 10.0  # Seconds to transition
@@ -367,6 +479,33 @@ class WeatherSystem:
         self.auto_change = True
         self.logger = logging.getLogger("mcp_games.engine.weather")
         
+        # Random draws come from one generator seeded from the random module,
+        # so seeding random still reproduces the weather
+        self._rng = np.random.default_rng(random.getrandbits(32))
+        self._transition_durations = _UniformStream(self._rng, 10, 30)
+        self._change_intervals = _UniformStream(self._rng, 180, 600)  # 3-10 minutes
+        
+        # Weather time and pending delayed callbacks, a heap of
+        # (fire time, tie-breaking id, callback)
+        self._clock = 0.0
+        self._timers: List[Tuple[float, int, Callable[[], None]]] = []
+        self._timer_ids = itertools.count()
+        
+        # Last applied ambient light and visibility range; negative until first set
+        self._last_ambient = -1.0
+        self._last_visibility = -1.0
+        
+        # Endpoints of the current transition, looked up once per set_weather;
+        # frames interpolate as from_vec + delta_vec * t
+        self._to_params = WeatherParameters.create_for_weather(self.current_weather)
+        self._from_vec = _PARAM_TABLE[self.current_weather.value]
+        self._delta_vec = np.zeros_like(self._from_vec)
+        self._params_vec = np.empty_like(self._from_vec)  # Interpolation output buffer
+        
+        # Per-second wind offset applied to physics objects, None when too weak
+        self._wind_offset: Optional[Tuple[float, float, float]] = None
+        self._update_wind()
+        
         # Weather effects
         self.particle_effect = ParticleWeatherEffect(self, self.current_params)
         self.lightning_effect = LightningEffect(self, self.current_params.lightning_chance)
@@ -374,6 +513,9 @@ class WeatherSystem:
         
         # Active effects
         self.active_effects: List[WeatherEffect] = []
+        # Whether the particle and fog effects are in active_effects
+        self._particle_active = False
+        self._fog_active = False
         
         # Initialize effects for current weather
         self._activate_effects_for_weather(self.current_weather)
@@ -388,10 +530,13 @@ class WeatherSystem:
         
         # Get parameters for this weather
         params = WeatherParameters.create_for_weather(weather)
+        self._particle_active = params.particle_count > 0
+        self._fog_active = params.fog_density > 0
         
         # Activate particle effect if needed
-        if params.particle_count > 0:
+        if self._particle_active:
             self.particle_effect.params = params
+            self.particle_effect._configure_particle_systems()
             self.particle_effect.start()
             self.active_effects.append(self.particle_effect)
         
@@ -402,7 +547,7 @@ class WeatherSystem:
             self.active_effects.append(self.lightning_effect)
         
         # Activate fog effect if needed
-        if params.fog_density > 0:
+        if self._fog_active:
             self.fog_effect.set_density(params.fog_density)
             self.fog_effect.set_color(params.fog_color)
             self.fog_effect.start()
@@ -424,6 +569,9 @@ class WeatherSystem:
             return
             
         self.target_weather = weather
+        self._to_params = WeatherParameters.create_for_weather(weather)
+        self._from_vec = _PARAM_TABLE[self.current_weather.value]
+        self._delta_vec = _DELTA_TABLE[self.current_weather.value, weather.value]
         self.transition_duration = max(0.1, transition_duration)
         self.transition_progress = 0.0
         
@@ -432,18 +580,50 @@ class WeatherSystem:
     
     def set_ambient_light(self, intensity: float):
         """Set ambient light intensity"""
+        if abs(intensity - self._last_ambient) < AMBIENT_LIGHT_EPSILON:
+            return
+        self._last_ambient = intensity
         # In a real implementation, we would adjust the renderer's lighting
         # For this example, we'll just log it
-        self.logger.debug(f"Ambient light set to {intensity:.2f}")
+        if self.logger.isEnabledFor(logging.DEBUG):
+            self.logger.debug(f"Ambient light set to {intensity:.2f}")
     
     def set_visibility_range(self, range_value: float):
         """Set visibility range"""
+        if abs(range_value - self._last_visibility) < VISIBILITY_RANGE_EPSILON:
+            return
+        self._last_visibility = range_value
         # In a real implementation, we would adjust the renderer's view distance
         # For this example, we'll just log it
-        self.logger.debug(f"Visibility range set to {range_value:.1f}")
+        if self.logger.isEnabledFor(logging.DEBUG):
+            self.logger.debug(f"Visibility range set to {range_value:.1f}")
+    
+    def schedule(self, delay: float, callback: Callable[[], None]):
+        """Call a function after a delay in seconds of weather time"""
+        heapq.heappush(self._timers, (self._clock + delay, next(self._timer_ids), callback))
+    
+    def _update_wind(self):
+        """Recompute the wind offset after the current parameters change"""
+        wind_strength = self.current_params.wind_strength
+        if wind_strength > 0.5:  # Only apply for stronger winds
+            self._wind_offset = (self.current_params.wind_direction.normalize() * (wind_strength * 0.01)).to_tuple()
+        else:
+            self._wind_offset = None
     
     def update(self, delta_time: float):
         """Update the weather system"""
+        # Nothing to do while the weather is settled with no automatic changes,
+        # effects or pending timers
+        if (self.transition_progress >= 1.0 and not self.auto_change
+                and not self.active_effects and not self._timers):
+            return
+        
+        # Fire delayed callbacks that have come due
+        self._clock += delta_time
+        timers = self._timers
+        while timers and timers[0][0] <= self._clock:
+            heapq.heappop(timers)[2]()
+        
         # Handle weather transitions
         if self.transition_progress < 1.0:
             # Update transition progress
@@ -452,50 +632,50 @@ class WeatherSystem:
                 # Transition complete
                 self.transition_progress = 1.0
                 self.current_weather = self.target_weather
-                self.current_params = WeatherParameters.create_for_weather(self.current_weather)
+                self.current_params = replace(self._to_params)
+                self._update_wind()
                 
                 # Activate effects for new weather
                 self._activate_effects_for_weather(self.current_weather)
             else:
                 # During transition, interpolate parameters
-                from_params = WeatherParameters.create_for_weather(self.current_weather)
-                to_params = WeatherParameters.create_for_weather(self.target_weather)
-                
-                # Linear interpolation between parameters
-                t = self.transition_progress
-                self.current_params.particle_count = int(from_params.particle_count * (1-t) + to_params.particle_count * t)
-                self.current_params.particle_size = from_params.particle_size * (1-t) + to_params.particle_size * t
-                self.current_params.particle_speed = from_params.particle_speed * (1-t) + to_params.particle_speed * t
-                self.current_params.wind_strength = from_params.wind_strength * (1-t) + to_params.wind_strength * t
-                self.current_params.fog_density = from_params.fog_density * (1-t) + to_params.fog_density * t
-                self.current_params.ambient_light = from_params.ambient_light * (1-t) + to_params.ambient_light * t
-                self.current_params.visibility_range = from_params.visibility_range * (1-t) + to_params.visibility_range * t
+                # Linear interpolation between parameters into the preallocated buffer
+                params_vec = self._params_vec
+                if _interp_params_jit is not None:
+                    _interp_params_jit(self._from_vec, self._delta_vec, self.transition_progress, params_vec)
+                else:
+                    np.multiply(self._delta_vec, self.transition_progress, out=params_vec)
+                    params_vec += self._from_vec
+                params = self.current_params
+                (particle_count, params.particle_size, params.particle_speed, params.wind_strength,
+                 params.fog_density, params.ambient_light, params.visibility_range, _) = params_vec.tolist()
+                params.particle_count = int(particle_count)
+                self._update_wind()
                 
                 # Update active effects with interpolated parameters
-                if self.particle_effect in self.active_effects:
+                if self._particle_active:
                     self.particle_effect.params = self.current_params
                 
-                if self.fog_effect in self.active_effects:
+                if self._fog_active:
                     self.fog_effect.set_density(self.current_params.fog_density)
                 
                 # Set ambient light and visibility
                 self.set_ambient_light(self.current_params.ambient_light)
                 self.set_visibility_range(self.current_params.visibility_range)
         
-        # Auto-change weather if enabled
-        if self.auto_change and self.transition_progress >= 1.0:
+        # Auto-change weather if enabled; the timer only runs between transitions
+        elif self.auto_change:
             self.time_until_change -= delta_time
             if self.time_until_change <= 0:
                 # Choose a new random weather
-                new_weather = random.choice(list(WeatherType))
-                while new_weather == self.current_weather:
-                    new_weather = random.choice(list(WeatherType))
+                candidates = _OTHER_WEATHER[self.current_weather]
+                new_weather = candidates[int(self._rng.integers(len(candidates)))]
                 
                 # Set new weather with transition
-                self.set_weather(new_weather, random.uniform(10, 30))
+                self.set_weather(new_weather, self._transition_durations.next())
                 
                 # Reset timer
-                self.time_until_change = random.uniform(180, 600)  # 3-10 minutes
+                self.time_until_change = self._change_intervals.next()
         
         # Update active effects
         for effect in self.active_effects:
@@ -507,17 +687,43 @@ class WeatherSystem:
         if hasattr(game_object, 'get_property'):
             collider = game_object.get_property('collider')
             if collider and hasattr(collider, 'game_object'):
-                # Calculate wind force based on object size and wind parameters
-                wind_dir = self.current_params.wind_direction
-                wind_strength = self.current_params.wind_strength
-                
                 # In a real physics system, we would apply a force to the object
                 # For this example, we'll just apply a small position offset
-                if wind_strength > 0.5:  # Only apply for stronger winds
-                    pos = Vector3.from_tuple(game_object.position)
-                    wind_effect = wind_dir.normalize() * (wind_strength * 0.01 * delta_time)
-                    new_pos = pos + wind_effect
-                    game_object.position = new_pos.to_tuple()
+                if self._wind_offset is not None:
+                    x, y, z = game_object.position
+                    wind_x, wind_y, wind_z = self._wind_offset
+                    game_object.position = (x + wind_x * delta_time, y + wind_y * delta_time,
+                                            z + wind_z * delta_time)
+    
+    def apply_weather_effects_batch(self, positions: np.ndarray, delta_time: float) -> bool:
+        """Apply weather effects in place to an (N, 3) array of physics object positions
+        
+        Returns False, leaving the array untouched, when the weather has no effect.
+        """
+        if self._wind_offset is None:
+            return False
+        positions += np.multiply(self._wind_offset, delta_time)
+        return True
+    
+    def apply_weather_effects_to_objects(self, game_objects: List[Any], delta_time: float):
+        """Apply weather effects to all physics objects in one batch"""
+        if self._wind_offset is None:
+            return
+        
+        # Gather the physics objects' positions into one array
+        affected = []
+        for game_object in game_objects:
+            if hasattr(game_object, 'get_property'):
+                collider = game_object.get_property('collider')
+                if collider and hasattr(collider, 'game_object'):
+                    affected.append(game_object)
+        if not affected:
+            return
+        positions = np.array([game_object.position for game_object in affected], dtype=np.float64)
+        
+        self.apply_weather_effects_batch(positions, delta_time)
+        for game_object, position in zip(affected, positions.tolist()):
+            game_object.position = tuple(position)
     
     def get_weather_description(self) -> str:
         """Get a text description of the current weather"""